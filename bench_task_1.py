@@ -0,0 +1,140 @@
+import random
+import sys
+import time
+import tracemalloc
+
+from task_1 import LinkedList, Node, merge_k_sorted_lists, merge_sorted_lists
+from task_1_compact import CompactLinkedList
+
+
+class DictNode:
+    """Node without __slots__, matching the original task_1.Node layout"""
+    def __init__(self, data=None):
+        self.data = data
+        self.next = None
+
+
+def timed(func, *args):
+    """Run func once and return (result, elapsed seconds)"""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def bench_construction(sizes):
+    """Time insert_at_end and from_iterable for growing list sizes"""
+    print("Construction time (seconds)")
+    print(f"{'n':>10}{'insert_at_end':>16}{'from_iterable':>16}")
+    for n in sizes:
+        def build_by_append():
+            llist = LinkedList()
+            for i in range(n):
+                llist.insert_at_end(i)
+            return llist
+
+        _, append_time = timed(build_by_append)
+        _, bulk_time = timed(LinkedList.from_iterable, range(n))
+        print(f"{n:>10}{append_time:>16.4f}{bulk_time:>16.4f}")
+    print()
+
+
+def bench_node_memory(n):
+    """Compare allocated bytes per node with and without __slots__"""
+    def measure(node_cls):
+        tracemalloc.start()
+        head = node_cls(0)
+        cur = head
+        for i in range(1, n):
+            cur.next = node_cls(i)
+            cur = cur.next
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return size / n
+
+    print(f"Memory per node (bytes, n={n}, int payloads included)")
+    print(f"Without __slots__: {measure(DictNode):.1f}")
+    print(f"With __slots__:    {measure(Node):.1f}")
+    print()
+
+
+def sort_via_python_list(llist):
+    """Baseline: copy values to a list, sorted() them and rebuild the list"""
+    values = []
+    current = llist.head
+    while current:
+        values.append(current.data)
+        current = current.next
+    return LinkedList.from_iterable(sorted(values))
+
+
+def bench_sort(sizes):
+    """Compare in-place LinkedList.sort with the copy/sorted/rebuild baseline"""
+    print("Sort time (seconds)")
+    print(f"{'n':>10}{'LinkedList.sort':>18}{'sorted()+rebuild':>18}")
+    for n in sizes:
+        values = [random.random() for _ in range(n)]
+        llist = LinkedList.from_iterable(values)
+        _, inplace_time = timed(llist.sort)
+        llist = LinkedList.from_iterable(values)
+        _, baseline_time = timed(sort_via_python_list, llist)
+        print(f"{n:>10}{inplace_time:>18.4f}{baseline_time:>18.4f}")
+    print()
+
+
+def bench_k_way_merge(total, ks):
+    """Compare one k-way merge against k-1 pairwise merges"""
+    print(f"Merging k sorted lists, {total} values in total (seconds)")
+    print(f"{'k':>10}{'pairwise':>16}{'k-way':>16}")
+    for k in ks:
+        chunks = [sorted(random.random() for _ in range(total // k)) for _ in range(k)]
+
+        def pairwise():
+            merged = LinkedList.from_iterable(chunks[0])
+            for chunk in chunks[1:]:
+                merged = merge_sorted_lists(merged, LinkedList.from_iterable(chunk))
+            return merged
+
+        def k_way():
+            return merge_k_sorted_lists(*(LinkedList.from_iterable(chunk) for chunk in chunks))
+
+        _, pairwise_time = timed(pairwise)
+        _, k_way_time = timed(k_way)
+        print(f"{k:>10}{pairwise_time:>16.4f}{k_way_time:>16.4f}")
+    print()
+
+
+def bench_compact_backend(n):
+    """Compare memory and throughput of the Node and array-backed lists"""
+    values = [random.randrange(n) for _ in range(n)]
+    print(f"Node-based vs array-backed list, n={n}")
+    print(f"{'':>22}{'LinkedList':>14}{'Compact':>14}")
+
+    results = {}
+    for name, cls in (("LinkedList", LinkedList), ("Compact", CompactLinkedList)):
+        tracemalloc.start()
+        llist, build_time = timed(cls.from_iterable, values)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        _, reverse_time = timed(llist.reverse)
+        _, sort_time = timed(llist.sort)
+        _, display_time = timed(llist.display)
+        results[name] = (size / n, build_time, reverse_time, sort_time, display_time)
+
+    rows = ("bytes per element", "build (s)", "reverse (s)", "sort (s)", "display (s)")
+    for i, row in enumerate(rows):
+        print(f"{row:>22}{results['LinkedList'][i]:>14.4f}{results['Compact'][i]:>14.4f}")
+    print()
+
+
+def main():
+    # Sizes can be overridden from the command line: python bench_task_1.py 1000 100000
+    sizes = [int(arg) for arg in sys.argv[1:]]
+    bench_construction(sizes or [10**3, 10**4, 10**5, 10**6])
+    bench_sort(sizes or [10**3, 10**4, 10**5, 10**6, 10**7])
+    bench_k_way_merge(10**5, [2, 8, 32, 128])
+    bench_node_memory(10**5)
+    bench_compact_backend(max(sizes or [10**6]))
+
+
+if __name__ == "__main__":
+    main()
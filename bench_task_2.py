@@ -0,0 +1,89 @@
+import io
+import os
+import sys
+import tempfile
+import time
+
+from task_2_export import save_png, write_svg
+from task_2_geometry import canonical_subtree, pythagoras_tree, pythagoras_tree_cached
+from task_2_tiles import render_tiled
+
+SIZE = 600  # Large enough that level 18 squares are still above the 1 pixel cutoff
+
+
+def timed(func, *args, **kwargs):
+    """Run func once and return elapsed seconds"""
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def turtle_time(level):
+    """Time the recursive turtle version with tracer(0), None without a display"""
+    try:
+        import turtle
+        from task_2 import recursive_pythagoras_tree
+
+        screen = turtle.Screen()
+        screen.clearscreen()
+        screen.tracer(0)
+        t = turtle.Turtle()
+        t.hideturtle()
+        t.penup()
+        t.goto(0, -200)
+        t.pendown()
+
+        def draw():
+            recursive_pythagoras_tree(t, SIZE, 90, level)
+            screen.update()
+
+        return timed(draw)
+    except Exception:
+        return None
+
+
+def bench_geometry(levels):
+    """Compare level-by-level geometry with the cached-subtree mode"""
+    print("Pythagoras tree geometry time (seconds)")
+    print(f"{'level':>6}{'direct':>10}{'cached':>10}{'warm':>10}")
+    for level in levels:
+        canonical_subtree.cache_clear()
+        direct_time = timed(pythagoras_tree, size=SIZE, level=level, min_size=0)
+        cached_time = timed(pythagoras_tree_cached, size=SIZE, level=level, min_size=0)
+        warm_time = timed(pythagoras_tree_cached, size=SIZE, level=level, min_size=0)
+        print(f"{level:>6}{direct_time:>10.3f}{cached_time:>10.3f}{warm_time:>10.3f}")
+    print()
+
+
+def bench_tiled(width, height, level, worker_counts):
+    """Time tiled rendering with a growing number of worker processes"""
+    print(f"Tiled rendering of a level {level} tree at {width}x{height} (seconds)")
+    print(f"{'workers':>8}{'time':>10}{'speedup':>10}")
+    baseline = None
+    for workers in worker_counts:
+        seconds = timed(render_tiled, width, height, size=SIZE, level=level,
+                        tile_size=512, workers=workers)
+        baseline = baseline or seconds
+        print(f"{workers:>8}{seconds:>10.3f}{baseline / seconds:>10.2f}")
+    print()
+
+
+def main():
+    levels = [int(arg) for arg in sys.argv[1:]] or list(range(10, 19))
+    bench_geometry(levels)
+    workers = os.cpu_count() or 1
+    bench_tiled(4096, 4096, max(levels), sorted({1, 2, 4, workers}))
+    print("Pythagoras tree render time (seconds)")
+    print(f"{'level':>6}{'svg':>10}{'png':>10}{'turtle':>12}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for level in levels:
+            svg_time = timed(write_svg, io.StringIO(), size=SIZE, level=level)
+            png_path = os.path.join(tmp_dir, f"tree_{level}.png")
+            png_time = timed(save_png, png_path, size=SIZE, level=level)
+            turtle_seconds = turtle_time(level)
+            turtle_text = "no display" if turtle_seconds is None else f"{turtle_seconds:.3f}"
+            print(f"{level:>6}{svg_time:>10.3f}{png_time:>10.3f}{turtle_text:>12}")
+
+
+if __name__ == "__main__":
+    main()
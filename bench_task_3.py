@@ -0,0 +1,226 @@
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from task_3 import dijkstra, shortest_path
+from task_3_batch import distance_matrix
+from task_3_binary import convert_edge_list, load_graph
+from task_3_ch import ContractionHierarchy
+from task_3_csr import CSRGraph, dijkstra_csr
+from task_3_dynamic import DynamicShortestPathTree
+
+
+def grid_graph(side, seed=0):
+    """Road-network-like graph: a side x side grid with random positive weights"""
+    rng = random.Random(seed)
+    graph = {(x, y): {} for x in range(side) for y in range(side)}
+    for x in range(side):
+        for y in range(side):
+            for nx_, ny_ in ((x + 1, y), (x, y + 1)):
+                if nx_ < side and ny_ < side:
+                    weight = rng.uniform(1, 10)
+                    graph[(x, y)][(nx_, ny_)] = weight
+                    graph[(nx_, ny_)][(x, y)] = weight
+    return graph
+
+
+def random_graph(n, degree, max_weight=10, seed=0):
+    """Random directed graph with about degree out-edges per vertex and integer weights"""
+    rng = random.Random(seed)
+    graph = {vertex: {} for vertex in range(n)}
+    for vertex in range(n):
+        for neighbor in rng.sample(range(n), min(degree, n)):
+            if neighbor != vertex:
+                graph[vertex][neighbor] = rng.randint(1, max_weight)
+    return graph
+
+
+def timed(func, *args, **kwargs):
+    """Run func once and return (result, elapsed seconds)"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def adjacency_bytes(graph):
+    """Bytes allocated by a copy of the dict-of-dicts adjacency"""
+    tracemalloc.start()
+    copy = {vertex: dict(edges) for vertex, edges in graph.items()}
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del copy
+    return size
+
+
+def bench_csr(sides):
+    """Compare memory and Dijkstra time of dict-of-dicts and CSR graphs"""
+    print("Dict-of-dicts vs CSR")
+    print(f"{'vertices':>10}{'edges':>10}{'dict MB':>10}{'CSR MB':>10}"
+          f"{'dict (s)':>10}{'CSR (s)':>10}{'build (s)':>10}")
+    for side in sides:
+        graph = grid_graph(side)
+        csr, build_time = timed(CSRGraph.from_dict, graph)
+        start = (0, 0)
+        _, dict_time = timed(dijkstra, graph, start)
+        _, csr_time = timed(dijkstra_csr, csr, start)
+        print(f"{csr.num_vertices:>10}{csr.num_edges:>10}"
+              f"{adjacency_bytes(graph) / 2**20:>10.1f}{csr.nbytes / 2**20:>10.1f}"
+              f"{dict_time:>10.3f}{csr_time:>10.3f}{build_time:>10.3f}")
+    print()
+
+
+def bench_point_to_point(side, queries=20, seed=1):
+    """Average settled vertices and time per query for point-to-point methods"""
+    graph = grid_graph(side)
+    rng = random.Random(seed)
+    pairs = [((rng.randrange(side), rng.randrange(side)), (rng.randrange(side), rng.randrange(side)))
+             for _ in range(queries)]
+
+    # Every edge weighs at least 1, so the grid distance is admissible
+    def manhattan(vertex, target):
+        return abs(vertex[0] - target[0]) + abs(vertex[1] - target[1])
+
+    print(f"Point-to-point queries on a {side}x{side} grid ({queries} random pairs)")
+    print(f"{'method':>14}{'settled':>12}{'ms/query':>12}")
+    _, full_time = timed(lambda: [dijkstra(graph, source) for source, _ in pairs])
+    print(f"{'full dijkstra':>14}{len(graph):>12}{full_time / queries * 1000:>12.2f}")
+    for method in ('dijkstra', 'bidirectional', 'astar'):
+        settled = 0
+        start = time.perf_counter()
+        for source, target in pairs:
+            stats = {}
+            shortest_path(graph, source, target, method=method, heuristic=manhattan,
+                          reversed_graph=graph, stats=stats)
+            settled += stats['settled']
+        elapsed = time.perf_counter() - start
+        print(f"{method:>14}{settled // queries:>12}{elapsed / queries * 1000:>12.2f}")
+    print()
+
+
+def bench_contraction_hierarchy(side, queries=200, seed=2):
+    """Preprocessing cost and query time of the contraction-hierarchy index"""
+    graph = grid_graph(side)
+    rng = random.Random(seed)
+    vertices = list(graph)
+    pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(queries)]
+
+    hierarchy, build_time = timed(ContractionHierarchy.build, graph)
+    with tempfile.TemporaryDirectory() as index_dir:
+        hierarchy.save(index_dir)
+        hierarchy, load_time = timed(ContractionHierarchy.load, index_dir)
+        _, ch_time = timed(lambda: [hierarchy.shortest_path(s, t) for s, t in pairs])
+    _, p2p_time = timed(lambda: [shortest_path(graph, s, t) for s, t in pairs])
+
+    print(f"Contraction hierarchy on a {side}x{side} grid ({queries} random queries)")
+    print(f"build: {build_time:.2f} s, load (mmap): {load_time * 1000:.2f} ms")
+    print(f"shortest_path: {p2p_time / queries * 1000:.2f} ms/query")
+    print(f"CH with path unpacking: {ch_time / queries * 1000:.2f} ms/query")
+    print()
+
+
+def bench_queues(n, degrees):
+    """Compare Dijkstra priority queues on graphs of growing density"""
+    queues = (("heapq", 2), ("indexed", 2), ("indexed", 4), ("indexed", 8), ("bucket", 2))
+    print(f"Dijkstra priority queues, {n} vertices, integer weights 1..10 (seconds)")
+    print(f"{'degree':>8}" + "".join(f"{name if name != 'indexed' else f'{arity}-ary':>10}"
+                                    for name, arity in queues))
+    for degree in degrees:
+        graph = random_graph(n, degree)
+        row = f"{degree:>8}"
+        for name, arity in queues:
+            _, seconds = timed(dijkstra, graph, 0, queue=name, arity=arity)
+            row += f"{seconds:>10.3f}"
+        print(row)
+    print()
+
+
+def bench_batch(side, sources):
+    """Serial dijkstra_csr loop against the shared-memory process pool"""
+    graph = CSRGraph.from_dict(grid_graph(side))
+    chosen = graph.vertices[:sources]
+    print(f"Distance matrix for {sources} sources on a {side}x{side} grid (seconds)")
+    _, serial_time = timed(lambda: [dijkstra_csr(graph, source) for source in chosen])
+    print(f"{'serial':>12}{serial_time:>10.3f}")
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        _, pool_time = timed(distance_matrix, graph, chosen, workers=workers)
+        with tempfile.TemporaryDirectory() as out_dir:
+            _, mmap_time = timed(distance_matrix, graph, chosen, workers=workers,
+                                 out_path=os.path.join(out_dir, "distances.npy"))
+        print(f"{f'{workers} workers':>12}{pool_time:>10.3f}{mmap_time:>10.3f} (memmap output)")
+    print()
+
+
+def bench_dynamic(side, updates=200, seed=3):
+    """Cost of repairing a shortest-path tree against recomputing it"""
+    graph = grid_graph(side)
+    rng = random.Random(seed)
+    edges = [(u, v) for u in graph for v in graph[u]]
+    tree = DynamicShortestPathTree(graph, (0, 0))
+
+    _, full_time = timed(dijkstra, graph, (0, 0))
+    touched = 0
+    start = time.perf_counter()
+    for _ in range(updates):
+        u, v = rng.choice(edges)
+        touched += tree.set_edge(u, v, graph[u][v] * rng.uniform(0.5, 2))
+    update_time = (time.perf_counter() - start) / updates
+
+    print(f"Dynamic shortest-path tree on a {side}x{side} grid ({updates} random reweights)")
+    print(f"full dijkstra: {full_time * 1000:.2f} ms, {len(graph)} vertices")
+    print(f"repair: {update_time * 1000:.3f} ms/update, {touched / updates:.1f} vertices/update")
+    print()
+
+
+def read_edge_list(path):
+    """Baseline loader: parse a text edge list into the dict-of-dicts format"""
+    graph = {}
+    with open(path) as f:
+        for line in f:
+            source, target, weight = line.split()
+            graph.setdefault(source, {})[target] = float(weight)
+            graph.setdefault(target, {})
+    return graph
+
+
+def bench_binary(side):
+    """Start-up cost of text parsing against the memory-mapped binary format"""
+    graph = grid_graph(side)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        text_path = os.path.join(tmp_dir, "edges.txt")
+        binary_path = os.path.join(tmp_dir, "graph.bin")
+        with open(text_path, "w") as f:
+            for vertex, edges in graph.items():
+                for neighbor, weight in edges.items():
+                    f.write(f"{vertex[0]}_{vertex[1]} {neighbor[0]}_{neighbor[1]} {weight}\n")
+
+        text_graph, text_time = timed(read_edge_list, text_path)
+        _, convert_time = timed(convert_edge_list, text_path, binary_path)
+        binary_graph, load_time = timed(load_graph, binary_path)
+        _, text_query = timed(dijkstra, text_graph, "0_0")
+        _, binary_query = timed(dijkstra_csr, binary_graph, "0_0")
+        del binary_graph
+
+    print(f"Loading a {side}x{side} grid from disk (seconds)")
+    print(f"text -> dict-of-dicts: {text_time:.3f}, dijkstra: {text_query:.3f}")
+    print(f"one-off conversion to binary: {convert_time:.3f}")
+    print(f"binary mmap load: {load_time:.4f}, dijkstra_csr: {binary_query:.3f}")
+    print()
+
+
+def main():
+    # Grid sides can be overridden from the command line: python bench_task_3.py 100 300
+    sides = [int(arg) for arg in sys.argv[1:]] or [100, 300, 1000]
+    bench_csr(sides)
+    bench_point_to_point(max(sides))
+    bench_contraction_hierarchy(min(sides))
+    bench_queues(5000, [4, 32, 256])
+    bench_batch(min(sides), 64)
+    bench_dynamic(max(sides))
+    bench_binary(max(sides))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import heapq
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import task_4_heap
+from task_4_plot import save_heap_png
+from task_4_topk import top_k, top_k_array
+from task_4 import build_max_heap
+
+
+def timed(func, *args, **kwargs):
+    """Run func once and return (result, elapsed seconds)"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def bench_heapify(sizes):
+    """Compare heap construction in place against heapq and build_max_heap"""
+    print("Building a heap (seconds)")
+    columns = ("heapq", "build_max", "in_place", "2-ary", "4-ary", "8-ary")
+    print(f"{'n':>10}" + "".join(f"{name:>11}" for name in columns))
+    for n in sizes:
+        values = [random.random() for _ in range(n)]
+        times = [
+            timed(heapq.heapify, values.copy())[1],
+            timed(build_max_heap, values)[1],
+            timed(build_max_heap, values.copy(), in_place=True)[1],
+        ]
+        for arity in (2, 4, 8):
+            times.append(timed(task_4_heap.heapify, values.copy(), arity, max_heap=True)[1])
+        print(f"{n:>10}" + "".join(f"{seconds:>11.3f}" for seconds in times))
+    print()
+
+
+def bench_heapsort(sizes):
+    """Compare the in-place heapsort with sorted()"""
+    print("Sorting (seconds)")
+    print(f"{'n':>10}{'sorted':>11}{'2-ary':>11}{'4-ary':>11}")
+    for n in sizes:
+        values = [random.random() for _ in range(n)]
+        times = [timed(sorted, values)[1]]
+        for arity in (2, 4):
+            times.append(timed(task_4_heap.heapsort, values.copy(), arity)[1])
+        print(f"{n:>10}" + "".join(f"{seconds:>11.3f}" for seconds in times))
+    print()
+
+
+def bench_plot(sizes):
+    """Time rendering heaps to PNG with the index layout"""
+    print("Rendering to PNG (seconds)")
+    print(f"{'n':>10}{'full':>11}{'depth 8':>11}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "heap.png")
+        for n in sizes:
+            heap = sorted(random.random() for _ in range(n))
+            times = [
+                timed(save_heap_png, path, heap, cmap="viridis")[1],
+                timed(save_heap_png, path, heap, max_depth=8, cmap="viridis")[1],
+            ]
+            print(f"{n:>10}" + "".join(f"{seconds:>11.3f}" for seconds in times))
+    print()
+
+
+def bench_topk(sizes, k=100):
+    """Compare streaming top-k selection with sorting and heapq.nlargest"""
+    print(f"Top {k} of a stream (seconds)")
+    columns = ("sorted", "nlargest", "top_k", "top_k key", "chunked")
+    print(f"{'n':>10}" + "".join(f"{name:>11}" for name in columns))
+    for n in sizes:
+        array = np.random.rand(n)
+        values = array.tolist()
+        times = [
+            timed(lambda: sorted(values, reverse=True)[:k])[1],
+            timed(heapq.nlargest, k, values)[1],
+            timed(top_k, iter(values), k)[1],
+            timed(top_k, iter(values), k, key=abs)[1],
+            timed(top_k_array, array, k)[1],
+        ]
+        print(f"{n:>10}" + "".join(f"{seconds:>11.3f}" for seconds in times))
+    print()
+
+
+def main():
+    # Sizes can be overridden from the command line: python bench_task_4.py 100000
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10**6, 10**7]
+    bench_heapify(sizes)
+    bench_heapsort([min(sizes)])
+    bench_plot([min(sizes)])
+    bench_topk(sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from task_5 import (Node, bfs_traversal, build_graph, build_tree_from_list, dfs_traversal, iter_bfs, iter_dfs,
+                    iter_inorder, iter_postorder, morris_inorder, morris_preorder, tree_layout)
+from task_5_animation import animate_traversal
+from task_5_implicit import ImplicitTree, complete_order
+
+
+def timed(func, *args, **kwargs):
+    """Run func once and return (result, elapsed seconds)"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def peak_memory(func, *args):
+    """Return the peak number of bytes allocated while func runs"""
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def left_chain(n):
+    """A degenerate tree of n nodes where every node has only a left child"""
+    root = Node(0)
+    current = root
+    for i in range(1, n):
+        current.left = Node(i)
+        current = current.left
+    return root
+
+
+def consume(iterator):
+    count = 0
+    for _ in iterator:
+        count += 1
+    return count
+
+
+def find(iterator, value):
+    """Stop at the first node with the given value"""
+    for node in iterator:
+        if node.val == value:
+            return node
+    return None
+
+
+TRAVERSALS = [
+    ("dfs list", lambda root: len(dfs_traversal(root))),
+    ("bfs list", lambda root: len(bfs_traversal(root))),
+    ("iter_dfs", lambda root: consume(iter_dfs(root))),
+    ("iter_bfs", lambda root: consume(iter_bfs(root))),
+    ("inorder", lambda root: consume(iter_inorder(root))),
+    ("postorder", lambda root: consume(iter_postorder(root))),
+    ("morris in", lambda root: consume(morris_inorder(root))),
+    ("morris pre", lambda root: consume(morris_preorder(root))),
+]
+
+
+def bench_full(name, root):
+    """Time and peak memory of complete traversals"""
+    print(f"{name}: full traversal")
+    print(f"{'method':>12}{'seconds':>10}{'peak MiB':>10}")
+    for method, run in TRAVERSALS:
+        _, seconds = timed(run, root)
+        peak = peak_memory(run, root) / 2**20
+        print(f"{method:>12}{seconds:>10.3f}{peak:>10.2f}")
+    print()
+
+
+def bench_early_exit(root, value):
+    """Time to find one node with a list traversal versus a generator"""
+    print(f"Finding value {value} in DFS order (seconds)")
+    _, list_seconds = timed(lambda: find(dfs_traversal(root), value))
+    _, generator_seconds = timed(find, iter_dfs(root), value)
+    print(f"{'dfs list':>12}{list_seconds:>10.4f}")
+    print(f"{'iter_dfs':>12}{generator_seconds:>10.4f}")
+    print()
+
+
+def bench_implicit(n):
+    """Compare a linked tree of Node objects with an ImplicitTree of the same shape"""
+    print(f"Linked versus implicit tree, {n} nodes")
+    linked_memory = peak_memory(build_tree_from_list, range(n)) / 2**20
+    root, linked_build = timed(build_tree_from_list, range(n))
+    tree, implicit_build = timed(ImplicitTree, np.arange(n))
+    print(f"{'':>12}{'linked':>10}{'implicit':>10}")
+    print(f"{'build s':>12}{linked_build:>10.3f}{implicit_build:>10.3f}")
+    print(f"{'build MiB':>12}{linked_memory:>10.1f}{tree.values.nbytes / 2**20:>10.1f}")
+
+    complete_order.cache_clear()
+    _, first = timed(tree.dfs_values, "preorder")
+    _, cached = timed(ImplicitTree(tree.values).dfs_values, "preorder")
+    _, linked_dfs = timed(lambda: [node.val for node in iter_dfs(root)])
+    print(f"{'dfs values s':>12}{linked_dfs:>10.3f}{first:>10.3f}  (first call)")
+    print(f"{'':>12}{'':>10}{cached:>10.3f}  (same shape, cached)")
+    _, linked_bfs = timed(lambda: [node.val for node in iter_bfs(root)])
+    _, implicit_bfs = timed(tree.bfs_values)
+    print(f"{'bfs values s':>12}{linked_bfs:>10.3f}{implicit_bfs:>10.3f}")
+    print()
+
+
+def bench_layout(n):
+    """Time the integer-id layout against building the networkx graph"""
+    print(f"Layout of {n} nodes (seconds)")
+    root = build_tree_from_list(range(n))
+    chain = left_chain(n)
+    tree = ImplicitTree(np.arange(n))
+    print(f"{'tree_layout linked':>24}{timed(tree_layout, root)[1]:>10.3f}")
+    print(f"{'tree_layout left chain':>24}{timed(tree_layout, chain)[1]:>10.3f}")
+    print(f"{'tree_layout implicit':>24}{timed(tree_layout, tree)[1]:>10.3f}")
+    print(f"{'build_graph (networkx)':>24}{timed(build_graph, root)[1]:>10.3f}")
+    print()
+
+
+def bench_animation(sizes, frames=50):
+    """Time per animation frame; it should not grow with the tree"""
+    print(f"Animating BFS in {frames} frames (milliseconds per frame)")
+    print(f"{'n':>10}{'gif':>10}{'png':>10}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for n in sizes:
+            tree = ImplicitTree(np.arange(n))
+            per_frame = []
+            for out in ("bfs.gif", "frames"):
+                path = os.path.join(tmp_dir, out)
+                written, total = timed(animate_traversal, tree, 'BFS', path, nodes_per_frame=max(1, n // frames))
+                # A two-frame run measures the one-off cost of drawing the whole tree
+                _, setup = timed(animate_traversal, tree, 'BFS', path, nodes_per_frame=n)
+                per_frame.append((total - setup) / (written - 2) * 1000)
+            print(f"{n:>10}" + "".join(f"{ms:>10.1f}" for ms in per_frame))
+    print()
+
+
+def main():
+    # Sizes can be overridden from the command line: python bench_task_5.py 1000000 10000000
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10**6]
+    bench_animation([1000, 100000])
+    for n in sizes:
+        root, seconds = timed(build_tree_from_list, range(n))
+        print(f"Built a complete tree of {n} nodes in {seconds:.2f} s\n")
+        bench_full(f"Complete tree, {n} nodes", root)
+        bench_early_exit(root, 20)
+        del root
+
+        chain = left_chain(n)
+        bench_full(f"Left chain, {n} nodes", chain)
+        del chain
+
+        bench_implicit(n)
+        bench_layout(n)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,12 @@
+import heapq
+import io
+from collections import deque
+from itertools import chain, islice
+from operator import itemgetter
+
 class Node:
+    __slots__ = ("data", "next")
+
     def __init__(self, data=None):
         self.data = data
         self.next = None
@@ -6,27 +14,95 @@ class Node:
 class LinkedList:
     def __init__(self):
         self.head = None
+        self.tail = None
+        self.length = 0
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Build a linked list from any iterable in linear time"""
+        llist = cls()
+        llist.extend(iterable)
+        return llist
 
     def insert_at_end(self, data):
+        node = Node(data)
         if not self.head:
-            self.head = Node(data)
+            self.head = node
+        else:
+            self.tail.next = node
+        self.tail = node
+        self.length += 1
+
+    def extend(self, iterable):
+        """Append all values from an iterable, linking nodes from the tail"""
+        # Build a detached chain first, so an iterable that raises leaves the list
+        # unchanged and extending a list with itself does not see the new nodes
+        head = tail = None
+        count = 0
+        for data in iterable:
+            node = Node(data)
+            if tail is None:
+                head = node
+            else:
+                tail.next = node
+            tail = node
+            count += 1
+        if head is None:
+            return
+        if self.tail is None:
+            self.head = head
         else:
-            cur = self.head
-            while cur.next:
-                cur = cur.next
-            cur.next = Node(data)
+            self.tail.next = head
+        self.tail = tail
+        self.length += count
 
-    def display(self):
+    def __iter__(self):
         current = self.head
-        elements = []
         while current:
-            elements.append(str(current.data))
+            yield current.data
             current = current.next
-        return " -> ".join(elements)
+
+    def __len__(self):
+        return self.length
+
+    def display(self, first=None, last=0):
+        """Return the list as a string, optionally as a "first ... last" preview"""
+        buffer = io.StringIO()
+        self.write(buffer, first=first, last=last)
+        return buffer.getvalue()
+
+    def write(self, file, separator=" -> ", chunk_size=65536, first=None, last=0):
+        """
+        Stream the list to a file-like object in chunks of about chunk_size characters.
+        
+        When first is given and the list holds more than first + last values,
+        only the first `first` and the last `last` values are written with
+        "..." between them. The list is walked at most once.
+        """
+        values = iter(self)
+        if first is not None and self.length > first + last:
+            head_values = list(islice(values, first))
+            # Walk the rest once, keeping only the last values
+            tail_values = deque(values, maxlen=last) if last else ()
+            values = chain(head_values, ["..."], tail_values)
+        
+        chunk = []
+        size = 0
+        for i, value in enumerate(values):
+            piece = str(value) if i == 0 else separator + str(value)
+            chunk.append(piece)
+            size += len(piece)
+            if size >= chunk_size:
+                file.write("".join(chunk))
+                chunk = []
+                size = 0
+        if chunk:
+            file.write("".join(chunk))
     
     def reverse(self):
         previous = None
         current = self.head
+        self.tail = current
         
         while current:
             next_node = current.next  
@@ -36,64 +112,116 @@ class LinkedList:
             
         self.head = previous 
     
-    def sort(self):
-        self.head = self._merge_sort(self.head)
+    def sort(self, key=None, reverse=False):
+        """Stable in-place sort with the same key/reverse semantics as sorted()"""
+        if key is None:
+            self.head, self.tail = self._merge_sort(self.head, None, reverse)
+            return
+        # Like sorted(), call key once per item: pair each value with its key for the merges
+        nodes = []
+        current = self.head
+        while current:
+            nodes.append(current)
+            current = current.next
+        keys = [key(node.data) for node in nodes]  # A failing key leaves the list untouched
+        for node, node_key in zip(nodes, keys):
+            node.data = (node_key, node.data)
+        try:
+            self.head, self.tail = self._merge_sort(self.head, itemgetter(0), reverse)
+        finally:
+            for node in nodes:
+                node.data = node.data[1]
         
-    def _merge_sort(self, head):
-        """Helper function for merge sort"""
-        # Base case
-        if not head or not head.next:
-            return head
+    def _merge_sort(self, head, key=None, reverse=False):
+        """Bottom-up merge sort that relinks nodes, returns (head, tail)"""
+        # Count the nodes once to know how many passes are needed
+        n = 0
+        current = head
+        while current:
+            n += 1
+            current = current.next
+        if n < 2:
+            return head, head
             
-        # Get the middle of the list
-        middle = self._get_middle(head)
-        next_to_middle = middle.next
-        middle.next = None
+        dummy = Node()
+        dummy.next = head
+        tail = None
+        width = 1
         
-        # Apply merge sort recursively
-        left = self._merge_sort(head)
-        right = self._merge_sort(next_to_middle)
-        
-        # Merge the sorted halves
-        sorted_list = self._sorted_merge(left, right)
-        return sorted_list
-        
-    def _get_middle(self, head):
-        """Helper function to find the middle node"""
-        if not head:
-            return head
+        # Merge neighbouring runs of length width, doubling width each pass
+        while width < n:
+            tail = dummy
+            current = dummy.next
+            while current:
+                left = current
+                right = self._split(left, width)
+                current = self._split(right, width)
+                merged_head, merged_tail = self._merge_nodes(left, right, key, reverse)
+                tail.next = merged_head
+                tail = merged_tail
+            width *= 2
             
-        slow = head
-        fast = head
+        return dummy.next, tail
         
-        while fast.next and fast.next.next:
-            slow = slow.next
-            fast = fast.next.next
-            
-        return slow
+    def _split(self, head, n):
+        """Cut the chain after n nodes and return the head of the rest"""
+        for _ in range(n - 1):
+            if not head:
+                return None
+            head = head.next
+        if not head:
+            return None
+        rest = head.next
+        head.next = None
+        return rest
         
-    def _sorted_merge(self, a, b):
+    def _sorted_merge(self, a, b, key=None, reverse=False):
         """Merge two sorted linked lists"""
-        result = None
+        return self._merge_nodes(a, b, key, reverse)[0]
         
-        # Base cases
-        if not a:
-            return b
-        if not b:
-            return a
-            
-        # Pick either a or b and recur
-        if a.data <= b.data:
-            result = a
-            result.next = self._sorted_merge(a.next, b)
+    def _merge_nodes(self, a, b, key=None, reverse=False):
+        """Iteratively merge two sorted chains, returns (head, tail)"""
+        dummy = Node()
+        tail = dummy
+        
+        # Take from b only when it is strictly smaller, which keeps the merge stable
+        if key is None and not reverse:
+            while a and b:
+                if b.data < a.data:
+                    tail.next = b
+                    b = b.next
+                else:
+                    tail.next = a
+                    a = a.next
+                tail = tail.next
         else:
-            result = b
-            result.next = self._sorted_merge(a, b.next)
+            if key is None:
+                key = lambda value: value
+            while a and b:
+                key_a = key(a.data)
+                key_b = key(b.data)
+                if (key_a < key_b) if reverse else (key_b < key_a):
+                    tail.next = b
+                    b = b.next
+                else:
+                    tail.next = a
+                    a = a.next
+                tail = tail.next
+                
+        # Attach the remainder and walk to its last node
+        tail.next = a if a else b
+        while tail.next:
+            tail = tail.next
             
-        return result
+        return dummy.next, tail
 
 def merge_sorted_lists(list1, list2):
-    """Merge two sorted linked lists into one sorted list"""
+    """
+    Merge two sorted linked lists into one sorted list.
+    
+    The nodes are relinked into the result, so both inputs are left empty
+    unless one of them was empty, in which case the other is returned.
+    """
     # Create a new linked list for the result
     merged_list = LinkedList()
     
@@ -105,10 +233,68 @@ def merge_sorted_lists(list1, list2):
         
     # Use the _sorted_merge helper to merge the heads
     helper = LinkedList()  # Create temporary instance just to use the method
-    merged_list.head = helper._sorted_merge(list1.head, list2.head)
+    merged_list.head, merged_list.tail = helper._merge_nodes(list1.head, list2.head)
+    merged_list.length = list1.length + list2.length
+    
+    # The nodes now belong to the merged list
+    for source in (list1, list2):
+        source.head = source.tail = None
+        source.length = 0
+    
+    return merged_list
+
+def _iter_nodes(head):
+    """Yield nodes of a chain, reading next before handing each node out"""
+    while head:
+        next_node = head.next
+        yield head
+        head = next_node
+
+def _node_stream(source):
+    """Yield existing nodes of a LinkedList, or fresh nodes for an iterable"""
+    if isinstance(source, LinkedList):
+        return _iter_nodes(source.head)
+    return (Node(data) for data in source)
+
+def merge_k_sorted_lists(*sources, key=None, reverse=False):
+    """
+    Merge any number of sorted linked lists or iterables into one sorted list.
+    
+    Nodes of LinkedList inputs are relinked into the result, so those inputs
+    are left empty. Runs in O(N log k) for N values across k sources.
+    """
+    if key is None:
+        node_key = lambda node: node.data
+    else:
+        node_key = lambda node: key(node.data)
+    
+    merged_list = LinkedList()
+    tail = None
+    count = 0
+    for node in heapq.merge(*map(_node_stream, sources), key=node_key, reverse=reverse):
+        if tail is None:
+            merged_list.head = node
+        else:
+            tail.next = node
+        tail = node
+        count += 1
+    if tail is not None:
+        tail.next = None
+    merged_list.tail = tail
+    merged_list.length = count
+    
+    # The nodes now belong to the merged list
+    for source in sources:
+        if isinstance(source, LinkedList):
+            source.head = source.tail = None
+            source.length = 0
     
     return merged_list
 
+def iter_merge_sorted(*sources, key=None, reverse=False):
+    """Lazily yield the merged values of sorted linked lists or iterables"""
+    return heapq.merge(*sources, key=key, reverse=reverse)
+
 def main():
     print("Example 1: Reversing a linked list")
     llist1 = LinkedList()
@@ -147,6 +333,22 @@ def main():
     
     merged_list = merge_sorted_lists(llist3, llist4)
     print(f"Merged sorted list: {merged_list.display()}")
+    print()
+    
+    print("Example 4: Merging several sorted lists")
+    sources = [
+        LinkedList.from_iterable([1, 4, 7]),
+        LinkedList.from_iterable([2, 5, 8]),
+        [0, 3, 6, 9],
+    ]
+    print(f"First three merged values: {list(islice(iter_merge_sorted(*sources), 3))}")
+    merged_list = merge_k_sorted_lists(*sources)
+    print(f"Merged sorted list: {merged_list.display()}")
+    print()
+    
+    print("Example 5: Previewing a long list")
+    long_list = LinkedList.from_iterable(range(1_000_000))
+    print(f"List of {len(long_list)} values: {long_list.display(first=3, last=2)}")
     
 if __name__ == "__main__":
     main()
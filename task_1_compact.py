@@ -0,0 +1,209 @@
+import heapq
+from array import array
+
+import numpy as np
+
+NIL = -1  # Index used in place of a None pointer
+NUMERIC_TYPECODES = "bBhHiIlLqQfd"  # Typecodes NumPy can view and sort in place
+
+
+class CompactLinkedList:
+    """
+    Singly linked list stored as parallel typed arrays instead of Node objects.
+
+    data[i] holds the value of slot i and next[i] the index of the following
+    slot (NIL at the end). Removed slots are threaded into a free list through
+    the same next array and reused by later inserts.
+    """
+    def __init__(self, typecode="q"):
+        self.typecode = typecode
+        self.data = array(typecode)
+        self.next = array("q")
+        self.head = NIL
+        self.tail = NIL
+        self.length = 0
+        self.free = NIL
+
+    @classmethod
+    def from_iterable(cls, iterable, typecode="q"):
+        """Build a compact list from any iterable in linear time"""
+        llist = cls(typecode)
+        llist.extend(iterable)
+        return llist
+
+    def __len__(self):
+        return self.length
+
+    def _alloc(self, data):
+        """Return a slot holding data, reusing a free slot when there is one"""
+        if self.free != NIL:
+            index = self.free
+            self.free = self.next[index]
+            self.data[index] = data
+            self.next[index] = NIL
+        else:
+            index = len(self.data)
+            self.data.append(data)
+            self.next.append(NIL)
+        return index
+
+    def insert_at_end(self, data):
+        index = self._alloc(data)
+        if self.head == NIL:
+            self.head = index
+        else:
+            self.next[self.tail] = index
+        self.tail = index
+        self.length += 1
+
+    def extend(self, iterable):
+        """Append all values, laying the new slots out contiguously"""
+        # Convert first, so a bad value cannot leave data longer than next
+        values = array(self.typecode, iterable)
+        start = len(self.data)
+        self.data.extend(values)
+        end = len(self.data)
+        if end == start:
+            return
+
+        # Each new slot points at its right neighbour, the last one at NIL
+        self.next.extend(range(start + 1, end + 1))
+        self.next[end - 1] = NIL
+
+        if self.head == NIL:
+            self.head = start
+        else:
+            self.next[self.tail] = start
+        self.tail = end - 1
+        self.length += end - start
+
+    def remove(self, data):
+        """Unlink the first slot holding data and put it on the free list"""
+        previous = NIL
+        current = self.head
+        while current != NIL and self.data[current] != data:
+            previous = current
+            current = self.next[current]
+        if current == NIL:
+            raise ValueError(f"{data!r} not in list")
+
+        following = self.next[current]
+        if previous == NIL:
+            self.head = following
+        else:
+            self.next[previous] = following
+        if current == self.tail:
+            self.tail = previous
+
+        self.next[current] = self.free
+        self.free = current
+        self.length -= 1
+
+    def __iter__(self):
+        data = self.data
+        for index in self._iter_indices():
+            yield data[index]
+
+    def _iter_indices(self):
+        """Yield slot indices in list order"""
+        current = self.head
+        next_ = self.next
+        while current != NIL:
+            yield current
+            current = next_[current]
+
+    def values(self):
+        """Return the values in list order as a Python list"""
+        return list(self)
+
+    def display(self):
+        return " -> ".join(map(str, self.values()))
+
+    def reverse(self):
+        previous = NIL
+        current = self.head
+        next_ = self.next
+        self.tail = current
+
+        while current != NIL:
+            next_index = next_[current]
+            next_[current] = previous
+            previous = current
+            current = next_index
+
+        self.head = previous
+
+    def sort(self, key=None, reverse=False):
+        """
+        Stable sort with the same key/reverse semantics as sorted().
+
+        Values are sorted into contiguous slots, which also drops the free
+        list. Without a key, numeric values are copied into one typed array
+        and sorted there in place with NumPy; otherwise the built-in sort is used.
+        """
+        if key is not None or self.typecode not in NUMERIC_TYPECODES:
+            self._rebuild(array(self.typecode, sorted(self, key=key, reverse=reverse)))
+            return
+        values = array(self.typecode, self)
+        view = np.frombuffer(values, dtype=self.typecode)
+        if reverse:
+            # Sorting the reversed view ascending leaves the array descending,
+            # with equal values still in their original order
+            view[::-1].sort(kind="stable")
+        else:
+            view.sort(kind="stable")
+        del view
+        self._rebuild(values)
+
+    def _rebuild(self, values):
+        """Take over a typed array of values as slots 0..n-1 in list order"""
+        n = len(values)
+        self.data = values
+        self.next = array("q", range(1, n + 1))
+        if n:
+            self.next[n - 1] = NIL
+        self.head = 0 if n else NIL
+        self.tail = n - 1 if n else NIL
+        self.length = n
+        self.free = NIL
+
+
+def merge_sorted_lists(list1, list2, key=None, reverse=False):
+    """Merge two sorted compact lists into a new compact list"""
+    merged_list = CompactLinkedList(list1.typecode)
+    merged_list.extend(heapq.merge(list1, list2, key=key, reverse=reverse))
+    return merged_list
+
+
+def main():
+    print("Example 1: Reversing a compact linked list")
+    llist1 = CompactLinkedList.from_iterable(range(1, 6))
+    print(f"Original list: {llist1.display()}")
+    llist1.reverse()
+    print(f"Reversed list: {llist1.display()}")
+    print()
+
+    print("Example 2: Sorting a compact linked list")
+    llist2 = CompactLinkedList.from_iterable([4, 2, 1, 3, 5])
+    print(f"Unsorted list: {llist2.display()}")
+    llist2.sort()
+    print(f"Sorted list: {llist2.display()}")
+    print()
+
+    print("Example 3: Merging two sorted compact lists")
+    llist3 = CompactLinkedList.from_iterable([1, 3, 5])
+    llist4 = CompactLinkedList.from_iterable([2, 4, 6])
+    print(f"First sorted list: {llist3.display()}")
+    print(f"Second sorted list: {llist4.display()}")
+    merged_list = merge_sorted_lists(llist3, llist4)
+    print(f"Merged sorted list: {merged_list.display()}")
+    print()
+
+    print("Example 4: Reusing freed slots")
+    llist3.remove(3)
+    llist3.insert_at_end(7)
+    print(f"List after remove(3) and insert_at_end(7): {llist3.display()}")
+    print(f"Slots allocated: {len(llist3.data)}")
+
+if __name__ == "__main__":
+    main()
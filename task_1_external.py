@@ -0,0 +1,123 @@
+import os
+import random
+import tempfile
+from array import array
+from itertools import islice
+
+from task_1 import LinkedList, iter_merge_sorted
+
+
+def write_run(values, path, typecode="q"):
+    """Write values to path as raw machine values of the given array typecode"""
+    with open(path, "wb") as f:
+        array(typecode, values).tofile(f)
+
+
+def read_run(path, typecode="q", buffer_size=4096):
+    """Stream the values of a run file back, buffer_size values at a time"""
+    with open(path, "rb") as f:
+        while True:
+            chunk = array(typecode)
+            try:
+                chunk.fromfile(f, buffer_size)
+            except EOFError:
+                # fromfile keeps whatever it managed to read before the end
+                yield from chunk
+                return
+            yield from chunk
+
+
+def spill_sorted_runs(iterable, tmp_dir, run_size=100_000, typecode="q", key=None, reverse=False):
+    """
+    Split iterable into runs of at most run_size values, sort each run in
+    memory with LinkedList.sort and write it to its own file in tmp_dir.
+
+    Returns the list of run file paths.
+    """
+    paths = []
+    iterator = iter(iterable)
+    while True:
+        run = LinkedList.from_iterable(islice(iterator, run_size))
+        if not len(run):
+            return paths
+        run.sort(key=key, reverse=reverse)
+        path = os.path.join(tmp_dir, f"run_{len(paths)}.bin")
+        write_run(run, path, typecode)
+        paths.append(path)
+
+
+def external_sort(iterable, run_size=100_000, buffer_size=4096, fan_in=64,
+                  typecode="q", key=None, reverse=False, tmp_dir=None):
+    """
+    Sort an iterable that may not fit in memory and yield the values in order.
+
+    Arguments:
+    iterable -- values to sort, must fit the array typecode
+    run_size -- number of values sorted in memory at once
+    buffer_size -- number of values read per run file at a time while merging
+    fan_in -- maximum number of runs merged (and files open) at once
+    typecode -- array typecode of the on-disk format, e.g. 'q' or 'd'
+    key, reverse -- same meaning as for sorted()
+    tmp_dir -- directory for the temporary run files (system default if None)
+
+    Peak memory is about run_size values while spilling and
+    fan_in * buffer_size values while merging. Run files are removed once the
+    generator is exhausted or closed.
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as work_dir:
+        paths = spill_sorted_runs(iterable, work_dir, run_size, typecode, key, reverse)
+
+        # Merge groups of runs into longer runs until one pass can finish the job
+        generation = 0
+        while len(paths) > fan_in:
+            merged_paths = []
+            for start in range(0, len(paths), fan_in):
+                group = paths[start:start + fan_in]
+                path = os.path.join(work_dir, f"merge_{generation}_{len(merged_paths)}.bin")
+                with open(path, "wb") as f:
+                    for chunk in _chunks(_merge_runs(group, typecode, buffer_size, key, reverse), buffer_size):
+                        array(typecode, chunk).tofile(f)
+                for old_path in group:
+                    os.remove(old_path)
+                merged_paths.append(path)
+            paths = merged_paths
+            generation += 1
+
+        yield from _merge_runs(paths, typecode, buffer_size, key, reverse)
+
+
+def _merge_runs(paths, typecode, buffer_size, key, reverse):
+    """k-way merge the sorted run files as a stream of values"""
+    streams = [read_run(path, typecode, buffer_size) for path in paths]
+    return iter_merge_sorted(*streams, key=key, reverse=reverse)
+
+
+def _chunks(iterator, size):
+    """Group an iterator into lists of at most size values"""
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def main():
+    print("External sort of 100000 random integers using runs of 10000 values")
+    values = [random.randint(-10**9, 10**9) for _ in range(100_000)]
+    result = list(external_sort(values, run_size=10_000, buffer_size=1024, fan_in=4))
+    print(f"Sorted correctly: {result == sorted(values)}")
+    print(f"First values: {result[:5]}")
+    print()
+
+    print("Sorting a LinkedList through external sort")
+    llist = LinkedList.from_iterable([4, 2, 1, 3, 5])
+    print(f"Unsorted list: {llist.display()}")
+    llist = LinkedList.from_iterable(external_sort(llist, run_size=2))
+    print(f"Sorted list: {llist.display()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,10 @@ import turtle
 import math
 import sys
 
+from task_2_geometry import iter_tree_vertices
+
+MAX_TURTLE_LEVEL = 20
+
 def recursive_pythagoras_tree(t, size, angle, level):
     """
     Draw a Pythagoras tree using recursion.
@@ -56,6 +60,29 @@ def recursive_pythagoras_tree(t, size, angle, level):
         print(f"An error occurred: {e}")
         return
 
+def draw_pythagoras_tree(t, size, angle, level, origin=(0, -200), branch_angle=45, cached=False):
+    """
+    Draw a Pythagoras tree from geometry computed by task_2_geometry.
+    
+    Turtle only moves between precomputed corners, so the same squares can
+    be rendered by other back ends as well. cached=True takes the bottom
+    levels from the cached canonical subtree.
+    """
+    try:
+        for vertices in iter_tree_vertices(size, angle, level, origin, branch_angle=branch_angle, cached=cached):
+            for square in vertices.tolist():
+                t.penup()
+                t.goto(square[0])
+                t.pendown()
+                for corner in square[1:] + square[:1]:
+                    t.goto(corner)
+        t.penup()
+        t.goto(origin)
+        t.pendown()
+    except turtle.Terminator:
+        print("Turtle window was closed")
+        return
+
 def main():
     # Setup the screen
     try:
@@ -74,18 +101,18 @@ def main():
         t.pendown()
         
         # Get recursion level from user
-        level_str = screen.textinput("Recursion Level", "Enter recursion level (1-10):")
+        level_str = screen.textinput("Recursion Level", f"Enter recursion level (1-{MAX_TURTLE_LEVEL}):")
         try:
             level = int(level_str)
             if level < 1:
                 level = 1
-            elif level > 10:
-                level = 10  # Limit to ensure stability
+            elif level > MAX_TURTLE_LEVEL:
+                level = MAX_TURTLE_LEVEL  # Limit to ensure stability
         except (ValueError, TypeError):
             level = 6  # Default value
         
-        # Draw the tree using recursive approach
-        recursive_pythagoras_tree(t, 80, 90, level)
+        # Draw the tree from the precomputed geometry
+        draw_pythagoras_tree(t, 80, 90, level)
         
         # Update the screen at the end
         screen.update()
@@ -0,0 +1,118 @@
+import math
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+
+from task_2_geometry import iter_tree_vertices
+
+SVG_CHUNK = 4096  # Squares formatted per write
+
+
+def tree_bounds(size=80, angle=90, level=6, origin=(0, -200), min_size=1.0, exact_levels=10,
+                branch_angle=45):
+    """
+    Return (xmin, ymin, xmax, ymax) enclosing the whole tree.
+
+    Only the first exact_levels levels are computed. Deeper squares shrink by
+    1/sqrt(2) per level, so they stay within sqrt(2) * s / (1 - 1/sqrt(2))
+    of the last computed level, where s is the size of its children.
+    """
+    xmin = ymin = math.inf
+    xmax = ymax = -math.inf
+    depth = 0
+    for vertices in iter_tree_vertices(size, angle, min(level, exact_levels), origin, min_size,
+                                       branch_angle):
+        points = vertices.reshape(-1, 2)
+        xmin, ymin = np.minimum((xmin, ymin), points.min(axis=0))
+        xmax, ymax = np.maximum((xmax, ymax), points.max(axis=0))
+        depth += 1
+
+    if depth == 0:
+        x, y = origin
+        return x, y, x, y
+    pad = 0.0
+    if level > depth:
+        ratio = 1 / math.sqrt(2)
+        pad = math.sqrt(2) * size * ratio ** depth / (1 - ratio)
+    return float(xmin - pad), float(ymin - pad), float(xmax + pad), float(ymax + pad)
+
+
+def write_svg(file, size=80, angle=90, level=6, origin=(0, -200), min_size=1.0,
+              bounds=None, stroke="black", stroke_width=None, branch_angle=45, cached=False):
+    """
+    Stream the tree to a file-like object as SVG, one level at a time.
+
+    Every level becomes a single <path>; squares are formatted in chunks of
+    SVG_CHUNK so the document is never held in memory as a whole. With
+    cached=True the geometry comes from the cached subtree, see
+    iter_tree_vertices, and every batch of subtree copies becomes a <path>.
+    """
+    if bounds is None:
+        bounds = tree_bounds(size, angle, level, origin, min_size, branch_angle=branch_angle)
+    xmin, ymin, xmax, ymax = bounds
+    width = xmax - xmin
+    height = ymax - ymin
+    if stroke_width is None:
+        stroke_width = max(width, height) / 1000
+
+    # Flip the y axis so the tree grows upwards like in turtle
+    file.write(
+        '<svg xmlns="http://www.w3.org/2000/svg" '
+        f'viewBox="{xmin:.2f} {-ymax:.2f} {width:.2f} {height:.2f}">\n'
+        f'<g transform="scale(1,-1)" fill="none" stroke="{stroke}" '
+        f'stroke-width="{stroke_width:.3g}">\n'
+    )
+    square_format = "M%.2f %.2fL%.2f %.2fL%.2f %.2fL%.2f %.2fZ"
+    for vertices in iter_tree_vertices(size, angle, level, origin, min_size, branch_angle, cached):
+        file.write('<path d="')
+        for start in range(0, len(vertices), SVG_CHUNK):
+            chunk = vertices[start:start + SVG_CHUNK].reshape(-1, 8)
+            file.write((square_format * len(chunk)) % tuple(chunk.ravel()))
+        file.write('"/>\n')
+    file.write("</g>\n</svg>\n")
+
+
+def save_svg(path, **kwargs):
+    """Write the tree to an SVG file, see write_svg for the arguments"""
+    with open(path, "w") as f:
+        write_svg(f, **kwargs)
+
+
+def save_png(path, size=80, angle=90, level=6, origin=(0, -200), min_size=1.0,
+             bounds=None, width=800, height=600, dpi=100, color="black", linewidth=0.5,
+             branch_angle=45, cached=False):
+    """
+    Render the tree to a PNG file without a display.
+
+    Each level (or, with cached=True, each batch of subtree copies) is added
+    as one PolyCollection and drawn by the Agg backend.
+    """
+    if bounds is None:
+        bounds = tree_bounds(size, angle, level, origin, min_size, branch_angle=branch_angle)
+    xmin, ymin, xmax, ymax = bounds
+
+    figure = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+    FigureCanvasAgg(figure)
+    ax = figure.add_axes((0, 0, 1, 1))
+    for vertices in iter_tree_vertices(size, angle, level, origin, min_size, branch_angle, cached):
+        ax.add_collection(PolyCollection(
+            vertices, facecolors="none", edgecolors=color, linewidths=linewidth,
+        ))
+    ax.set_xlim(xmin, xmax)
+    ax.set_ylim(ymin, ymax)
+    ax.set_aspect("equal")
+    ax.axis("off")
+    figure.savefig(path, dpi=dpi)
+
+
+def main():
+    save_svg("pythagoras_tree.svg", level=12)
+    print("Saved pythagoras_tree.svg")
+    save_png("pythagoras_tree.png", level=12)
+    print("Saved pythagoras_tree.png")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+import functools
+import math
+
+import numpy as np
+
+MAX_LEVEL = 24  # Levels actually drawn; 2**24 squares in the last level is about 1.3 GB of vertices
+SUBTREE_CACHE_SIZE = 32  # Canonical subtrees kept by canonical_subtree
+BRANCH_CACHE_SIZE = 32  # Branch angles kept by branch_matrices
+SUBTREE_DEPTH = 8  # Levels covered by the canonical subtree in the cached mode
+INSTANCE_BATCH = 1 << 16  # Squares per array yielded by iter_cached_vertices
+# A square of size s and all its descendants lie within SUBTREE_REACH * s of its center:
+# each level moves centers by at most s / sqrt(2) + s / 2 and shrinks by 1 / sqrt(2)
+SUBTREE_REACH = (1 / math.sqrt(2) + 0.5) / (1 - 1 / math.sqrt(2)) + 1 / math.sqrt(2)
+
+# Rotation matrix applied to row vectors (v @ M) for a +90 degree turn
+ROTATE_90 = np.array([[0.0, 1.0], [-1.0, 0.0]])
+
+
+def rotation(angle, scale=1.0):
+    """Return the row-vector matrix that rotates by angle degrees and scales"""
+    radians = math.radians(angle)
+    cos = scale * math.cos(radians)
+    sin = scale * math.sin(radians)
+    return np.array([[cos, sin], [-sin, cos]])
+
+
+@functools.lru_cache(maxsize=BRANCH_CACHE_SIZE)
+def branch_matrices(branch_angle=45):
+    """
+    Return the (left, right) edge transforms of the two branches.
+
+    Branch edges turn by +/-branch_angle and shrink by 1/sqrt(2), exactly
+    like the turtle version.
+    """
+    scale = 1 / math.sqrt(2)
+    return rotation(branch_angle, scale), rotation(-branch_angle, scale)
+
+
+def root_square(size=80, angle=90, origin=(0, -200)):
+    """
+    Return the (origins, edges) arrays of the first level.
+
+    A square is stored as its starting corner and its base edge vector, which
+    is what the turtle sees: position and heading times size.
+    """
+    radians = math.radians(angle)
+    origins = np.array([origin], dtype=float)
+    edges = np.array([[size * math.cos(radians), size * math.sin(radians)]])
+    return origins, edges
+
+
+def next_level(origins, edges, branch_angle=45):
+    """
+    Compute the squares of the next level with one batched affine transform.
+
+    Both branches of a square start at its corner opposite to the origin.
+    Children are laid out as all left branches followed by all right branches.
+    """
+    left, right = branch_matrices(branch_angle)
+    tops = origins + edges + edges @ ROTATE_90
+    new_origins = np.concatenate((tops, tops))
+    new_edges = np.concatenate((edges @ left, edges @ right))
+    return new_origins, new_edges
+
+
+def level_count(size, level, min_size=1.0):
+    """Return how many levels are drawn before squares drop below min_size"""
+    if min_size <= 0:
+        return level
+    for depth in range(level):
+        if size / math.sqrt(2) ** depth < min_size:
+            return depth
+    return level
+
+
+def iter_levels(size=80, angle=90, level=6, origin=(0, -200), min_size=1.0, branch_angle=45):
+    """
+    Yield (origins, edges) for every level of the tree, root first.
+
+    Stops after `level` levels or once squares get smaller than min_size,
+    which is the same cutoff as `size < 1` in the recursive version.
+    """
+    levels = level_count(size, level, min_size)
+    if levels > MAX_LEVEL:
+        raise ValueError(f"At most {MAX_LEVEL} levels can be built at once, "
+                         f"this tree has {levels} above min_size")
+    origins, edges = root_square(size, angle, origin)
+    for depth in range(levels):
+        yield origins, edges
+        if depth + 1 < levels:
+            origins, edges = next_level(origins, edges, branch_angle)
+
+
+def iter_levels_near(extent, size=80, angle=90, level=6, origin=(0, -200), min_size=1.0, branch_angle=45):
+    """
+    Yield (origins, edges) for every level, keeping only squares whose subtree can reach extent.
+
+    extent is an (xmin, ymin, xmax, ymax) rectangle. A square is dropped
+    together with its whole subtree once it is farther than SUBTREE_REACH
+    times its size from the rectangle, so memory depends on how much of the
+    tree lies near extent and MAX_LEVEL does not apply. Stops early when
+    nothing is left.
+    """
+    xmin, ymin, xmax, ymax = extent
+    levels = level_count(size, level, min_size)
+    origins, edges = root_square(size, angle, origin)
+    for depth in range(levels):
+        reach = SUBTREE_REACH * size / math.sqrt(2) ** depth
+        centers = origins + (edges + edges @ ROTATE_90) / 2
+        near = ((centers[:, 0] + reach >= xmin) & (centers[:, 0] - reach <= xmax)
+                & (centers[:, 1] + reach >= ymin) & (centers[:, 1] - reach <= ymax))
+        origins = origins[near]
+        edges = edges[near]
+        if len(origins) == 0:
+            return
+        yield origins, edges
+        if depth + 1 < levels:
+            origins, edges = next_level(origins, edges, branch_angle)
+
+
+def square_vertices(origins, edges):
+    """Return an (n, 4, 2) array with the corners of each square in drawing order"""
+    normals = edges @ ROTATE_90
+    vertices = np.empty((len(origins), 4, 2))
+    vertices[:, 0] = origins
+    vertices[:, 1] = origins + edges
+    vertices[:, 2] = origins + edges + normals
+    vertices[:, 3] = origins + normals
+    return vertices
+
+
+def iter_tree_vertices(size=80, angle=90, level=6, origin=(0, -200), min_size=1.0, branch_angle=45,
+                       cached=False, subtree_depth=SUBTREE_DEPTH):
+    """
+    Yield the (n, 4, 2) vertex array of each level.
+
+    With cached=True the arrays come from iter_cached_vertices instead, so
+    the bottom levels are grouped per subtree instance rather than per level.
+    """
+    if cached:
+        yield from iter_cached_vertices(size, angle, level, origin, min_size, branch_angle, subtree_depth)
+        return
+    for origins, edges in iter_levels(size, angle, level, origin, min_size, branch_angle):
+        yield square_vertices(origins, edges)
+
+
+def pythagoras_tree(size=80, angle=90, level=6, origin=(0, -200), min_size=1.0, branch_angle=45):
+    """Return the vertices of all squares as one (n, 4, 2) array, root first"""
+    levels = list(iter_tree_vertices(size, angle, level, origin, min_size, branch_angle))
+    if not levels:
+        return np.empty((0, 4, 2))
+    return np.concatenate(levels)
+
+
+@functools.lru_cache(maxsize=SUBTREE_CACHE_SIZE)
+def canonical_subtree(depth, branch_angle=45):
+    """
+    Return the read-only vertices of a depth-level subtree in local coordinates.
+
+    The root square has its origin at (0, 0) and base edge (1, 0), so a copy
+    rooted at origin p with edge e is p + x * e + y * rot90(e) for every
+    local vertex (x, y). Results are kept in an LRU cache keyed by depth and
+    branch angle, see canonical_subtree.cache_info().
+    """
+    vertices = pythagoras_tree(1, 0, depth, (0, 0), 0, branch_angle)
+    vertices.flags.writeable = False
+    return vertices
+
+
+def place_subtree(local_vertices, origins, edges):
+    """Map local subtree vertices onto every (origin, edge) instance, (k, m, 4, 2)"""
+    # One 2x2 matrix per instance: rows are the edge and its normal
+    transforms = np.stack((edges, edges @ ROTATE_90), axis=1)
+    points = local_vertices.reshape(1, -1, 2) @ transforms + origins[:, None, :]
+    return points.reshape(len(origins), *local_vertices.shape)
+
+
+def iter_cached_vertices(size=80, angle=90, level=6, origin=(0, -200), min_size=1.0,
+                         branch_angle=45, subtree_depth=SUBTREE_DEPTH):
+    """
+    Yield the squares of pythagoras_tree_cached as (n, 4, 2) arrays.
+
+    The top levels are computed directly, one array per level; every square
+    on the first level of the bottom subtree_depth levels is then replaced by
+    a transformed copy of the canonical subtree. Copies are yielded in
+    batches of about INSTANCE_BATCH squares.
+    """
+    levels = level_count(size, level, min_size)
+    if levels > MAX_LEVEL:
+        raise ValueError(f"At most {MAX_LEVEL} levels can be built at once, "
+                         f"this tree has {levels} above min_size")
+    if levels == 0:
+        return
+    depth = min(subtree_depth, levels)
+    origins, edges = root_square(size, angle, origin)
+    for _ in range(levels - depth):
+        yield square_vertices(origins, edges)
+        origins, edges = next_level(origins, edges, branch_angle)
+
+    local_vertices = canonical_subtree(depth, branch_angle)
+    step = max(1, INSTANCE_BATCH // len(local_vertices))
+    for start in range(0, len(origins), step):
+        copies = place_subtree(local_vertices, origins[start:start + step], edges[start:start + step])
+        yield copies.reshape(-1, 4, 2)
+
+
+def pythagoras_tree_cached(size=80, angle=90, level=6, origin=(0, -200), min_size=1.0,
+                           branch_angle=45, subtree_depth=SUBTREE_DEPTH):
+    """
+    Return the same squares as pythagoras_tree, reusing a cached subtree.
+
+    Squares are grouped per subtree instance instead of per level, see
+    iter_cached_vertices.
+    """
+    pieces = list(iter_cached_vertices(size, angle, level, origin, min_size, branch_angle, subtree_depth))
+    if not pieces:
+        return np.empty((0, 4, 2))
+    return np.concatenate(pieces)
+
+
+def main():
+    for level in (10, 15, 20):
+        squares = 0
+        for vertices in iter_tree_vertices(size=1000, level=level, min_size=0):
+            squares += len(vertices)
+        print(f"Level {level}: {squares} squares")
+
+    vertices = pythagoras_tree(level=3)
+    print("Squares of a level 3 tree:")
+    print(np.round(vertices, 2))
+
+    for branch_angle in (30, 45, 60):
+        pythagoras_tree_cached(size=1000, level=18, min_size=0, branch_angle=branch_angle)
+    print(f"Subtree cache: {canonical_subtree.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
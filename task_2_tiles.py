@@ -0,0 +1,167 @@
+import math
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+from PIL import Image
+
+from task_2_export import tree_bounds
+from task_2_geometry import (SUBTREE_DEPTH, canonical_subtree, iter_levels_near, level_count,
+                             place_subtree, square_vertices)
+
+DPI = 100
+TILES_PER_WORKER = 2  # Tiles submitted ahead of the one being stitched, per worker
+
+
+def render_tile(vertices, extent, tile_width, tile_height, linewidth=0.5):
+    """
+    Rasterize squares into one grayscale tile.
+
+    extent is the (xmin, ymin, xmax, ymax) world rectangle covered by the
+    tile. Returns a (tile_height, tile_width) uint8 array, 255 is background.
+    """
+    # Agg truncates the pixel size, and for example 928 / DPI * DPI is 927.99...
+    figure = Figure(figsize=((tile_width + 0.5) / DPI, (tile_height + 0.5) / DPI), dpi=DPI)
+    canvas = FigureCanvasAgg(figure)
+    if canvas.get_width_height() != (tile_width, tile_height):
+        raise RuntimeError(f"canvas is {canvas.get_width_height()}, expected {(tile_width, tile_height)}")
+    ax = figure.add_axes((0, 0, 1, 1))
+    ax.add_collection(PolyCollection(
+        vertices, facecolors="none", edgecolors="black", linewidths=linewidth,
+    ))
+    xmin, ymin, xmax, ymax = extent
+    ax.set_xlim(xmin, xmax)
+    ax.set_ylim(ymin, ymax)
+    ax.axis("off")
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba())[:, :, 0].copy()
+
+
+def tile_vertices(extent, size=80, angle=90, level=6, origin=(0, -200), min_size=1.0,
+                  branch_angle=45, cached=False, subtree_depth=SUBTREE_DEPTH):
+    """
+    Return the squares whose bounding box meets extent, without building the rest of the tree.
+
+    Levels are walked with iter_levels_near, which prunes subtrees that
+    cannot reach extent. With cached=True the bottom subtree_depth levels of
+    the surviving squares are transformed copies of the canonical subtree.
+    """
+    xmin, ymin, xmax, ymax = extent
+    levels = level_count(size, level, min_size)
+    if levels == 0:
+        return np.empty((0, 4, 2))
+    depth = min(subtree_depth, levels) if cached else 1
+    roots = levels - depth  # Level whose squares are replaced by subtree copies
+    pieces = []
+    for current, (origins, edges) in enumerate(
+            iter_levels_near(extent, size, angle, roots + 1, origin, 0, branch_angle)):
+        if cached and current == roots:
+            vertices = place_subtree(canonical_subtree(depth, branch_angle), origins, edges).reshape(-1, 4, 2)
+        else:
+            vertices = square_vertices(origins, edges)
+        lower = vertices.min(axis=1)
+        upper = vertices.max(axis=1)
+        meets = ((upper[:, 0] >= xmin) & (lower[:, 0] <= xmax)
+                 & (upper[:, 1] >= ymin) & (lower[:, 1] <= ymax))
+        pieces.append(vertices[meets])
+    return np.concatenate(pieces) if pieces else np.empty((0, 4, 2))
+
+
+def render_tree_tile(extent, tile_width, tile_height, linewidth, tree):
+    """
+    Build the squares of one tile in the worker and rasterize them.
+
+    tree holds the keyword arguments of tile_vertices. Returns None when no
+    square touches the tile.
+    """
+    vertices = tile_vertices(extent, **tree)
+    if len(vertices) == 0:
+        return None
+    return render_tile(vertices, extent, tile_width, tile_height, linewidth)
+
+
+def render_tiled(width, height, size=80, angle=90, level=6, origin=(0, -200),
+                 tile_size=1024, min_pixel=1.0, workers=None, out=None, linewidth=0.5,
+                 branch_angle=45, cached=False):
+    """
+    Render a Pythagoras tree into a (height, width) grayscale image tile by tile.
+
+    Squares smaller than min_pixel pixels are dropped, which generalizes the
+    `size < 1` cutoff of the turtle version to the output resolution. Each
+    tile is built and rasterized in a ProcessPoolExecutor worker from the
+    tree parameters alone, see tile_vertices, so the parent never holds the
+    geometry and deep trees are not limited by MAX_LEVEL. At most
+    TILES_PER_WORKER tiles per worker are in flight. out may be a
+    preallocated uint8 array, for example a np.memmap, for images that do
+    not fit in memory. cached=True builds the bottom levels from the cached
+    canonical subtree.
+    """
+    xmin, ymin, xmax, ymax = tree_bounds(size, angle, level, origin, min_size=0, branch_angle=branch_angle)
+    scale = min(width / (xmax - xmin), height / (ymax - ymin))  # pixels per unit
+    # Center the tree on the canvas
+    xmin -= (width / scale - (xmax - xmin)) / 2
+    ymax += (height / scale - (ymax - ymin)) / 2
+
+    tree = dict(size=size, angle=angle, level=level, origin=origin, min_size=min_pixel / scale,
+                branch_angle=branch_angle, cached=cached)
+    columns = math.ceil(width / tile_size)
+    rows = math.ceil(height / tile_size)
+
+    if out is None:
+        out = np.empty((height, width), dtype=np.uint8)
+    out[:] = 255
+
+    workers = workers or os.cpu_count() or 1
+    window = workers * TILES_PER_WORKER
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending = deque()
+        for tile in range(rows * columns):
+            row, column = divmod(tile, columns)
+            x0 = column * tile_size
+            y0 = row * tile_size
+            tile_width = min(tile_size, width - x0)
+            tile_height = min(tile_size, height - y0)
+            extent = (
+                xmin + x0 / scale,
+                ymax - (y0 + tile_height) / scale,
+                xmin + (x0 + tile_width) / scale,
+                ymax - y0 / scale,
+            )
+            future = executor.submit(render_tree_tile, extent, tile_width, tile_height, linewidth, tree)
+            pending.append((y0, x0, tile_height, tile_width, future))
+            if len(pending) >= window:
+                _stitch(out, *pending.popleft())
+        while pending:
+            _stitch(out, *pending.popleft())
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    return out
+
+
+def _stitch(out, y0, x0, tile_height, tile_width, future):
+    """Copy a finished tile into its (tile_height, tile_width) block of the output image"""
+    tile = future.result()
+    if tile is not None:
+        if tile.shape != (tile_height, tile_width):
+            raise ValueError(f"tile at ({y0}, {x0}) is {tile.shape}, expected {(tile_height, tile_width)}")
+        out[y0:y0 + tile_height, x0:x0 + tile_width] = tile
+
+
+def save_tiled_png(path, width, height, **kwargs):
+    """Render with render_tiled and save the stitched image as PNG"""
+    Image.fromarray(render_tiled(width, height, **kwargs)).save(path)
+
+
+def main():
+    save_tiled_png("pythagoras_tree_tiled.png", 4000, 3000, size=80, level=20,
+                   tile_size=512, workers=os.cpu_count())
+    print("Saved pythagoras_tree_tiled.png")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,25 @@
 import heapq
 
-def dijkstra(graph, start):
+from task_3_queues import BucketQueue, IndexedHeap
+
+def dijkstra(graph, start, queue='heapq', arity=2):
     """
     Dijkstra's algorithm for finding the shortest paths in a graph.
     
     Arguments:
     graph -- adjacency dictionary where keys are vertices, values are dictionaries of neighbors and edge weights
     start -- starting vertex
+    queue -- priority queue type: 'heapq' (lazy deletion), 'indexed' (d-ary heap with decrease-key)
+             or 'bucket' (Dial's algorithm, non-negative integer weights only)
+    arity -- number of children per node of the 'indexed' heap
     
     Returns:
     distances -- dictionary of shortest distances from the starting vertex to all others
     previous -- dictionary of previous vertices for path reconstruction
     """
+    if queue != 'heapq':
+        return _dijkstra_decrease_key(graph, start, queue, arity)
+    
     # Initialize distances and previous vertices
     distances = {vertex: float('infinity') for vertex in graph}
     previous = {vertex: None for vertex in graph}
@@ -40,6 +48,47 @@ def dijkstra(graph, start):
     
     return distances, previous
 
+def _dijkstra_decrease_key(graph, start, queue, arity):
+    """Dijkstra's algorithm with a priority queue that supports decrease-key"""
+    distances = {vertex: float('infinity') for vertex in graph}
+    previous = {vertex: None for vertex in graph}
+    distances[start] = 0
+    
+    if queue == 'indexed':
+        # The indexed heap works on vertex numbers
+        vertices = list(graph)
+        index = {vertex: i for i, vertex in enumerate(vertices)}
+        priority_queue = IndexedHeap(len(vertices), arity)
+        priority_queue.push(index[start], 0)
+    elif queue == 'bucket':
+        vertices = None
+        index = None
+        max_weight = 0
+        for edges in graph.values():
+            for weight in edges.values():
+                if weight < 0 or weight != int(weight):
+                    raise ValueError("queue 'bucket' needs non-negative integer weights")
+                max_weight = max(max_weight, int(weight))
+        priority_queue = BucketQueue(max_weight)
+        priority_queue.push(start, 0)
+    else:
+        raise ValueError(f"Unknown queue type: {queue}")
+    
+    while priority_queue:
+        # Every vertex is in the queue at most once, so there are no stale entries
+        current_distance, current_vertex = priority_queue.pop()
+        if index is not None:
+            current_vertex = vertices[current_vertex]
+        
+        for neighbor, weight in graph[current_vertex].items():
+            distance = current_distance + weight
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                previous[neighbor] = current_vertex
+                priority_queue.push(neighbor if index is None else index[neighbor], distance)
+    
+    return distances, previous
+
 def get_path(previous, target):
     """
     Reconstructs the path from the starting vertex to the target vertex.
@@ -62,6 +111,127 @@ def get_path(previous, target):
     # Reverse the path to go from the starting vertex to the target vertex
     return path[::-1]
 
+def reverse_graph(graph):
+    """
+    Returns the graph with every edge reversed, in the same adjacency format.
+    """
+    reversed_graph = {vertex: {} for vertex in graph}
+    for vertex, edges in graph.items():
+        for neighbor, weight in edges.items():
+            reversed_graph.setdefault(neighbor, {})[vertex] = weight
+    return reversed_graph
+
+def shortest_path(graph, source, target, method='dijkstra', heuristic=None,
+                  reversed_graph=None, stats=None):
+    """
+    Finds the shortest path between two vertices, stopping as soon as the target is settled.
+    
+    Arguments:
+    graph -- adjacency dictionary where keys are vertices, values are dictionaries of neighbors and edge weights
+    source -- starting vertex
+    target -- target vertex
+    method -- 'dijkstra', 'bidirectional' or 'astar'
+    heuristic -- for 'astar', function(vertex, target) returning an admissible estimate of the remaining distance
+    reversed_graph -- for 'bidirectional', the reversed graph (pass graph itself for undirected graphs);
+                      build it once with reverse_graph and reuse it across queries, since
+                      reversing costs O(V + E) and would outweigh the early exit
+    stats -- optional dictionary that receives the number of settled vertices under 'settled'
+    
+    Returns:
+    distance -- length of the shortest path, infinity if the target is unreachable
+    path -- list of vertices forming the shortest path, empty if the target is unreachable
+    """
+    if method == 'dijkstra':
+        distance, path, settled = _astar(graph, source, target, lambda vertex, target: 0)
+    elif method == 'astar':
+        if heuristic is None:
+            raise ValueError("method 'astar' needs a heuristic")
+        distance, path, settled = _astar(graph, source, target, heuristic)
+    elif method == 'bidirectional':
+        if reversed_graph is None:
+            raise ValueError("method 'bidirectional' needs reversed_graph, see reverse_graph")
+        distance, path, settled = _bidirectional(graph, reversed_graph, source, target)
+    else:
+        raise ValueError(f"Unknown method: {method}")
+    
+    if stats is not None:
+        stats['settled'] = settled
+    return distance, path
+
+def _astar(graph, source, target, heuristic):
+    """A* search; with a zero heuristic this is Dijkstra with early exit"""
+    distances = {source: 0}
+    previous = {source: None}
+    priority_queue = [(heuristic(source, target), 0, source)]
+    settled = 0
+    
+    while priority_queue:
+        _, current_distance, current_vertex = heapq.heappop(priority_queue)
+        
+        # Skip stale entries; vertices may be reopened if the heuristic is not consistent
+        if current_distance > distances[current_vertex]:
+            continue
+        settled += 1
+        if current_vertex == target:
+            return current_distance, get_path(previous, target), settled
+        
+        for neighbor, weight in graph[current_vertex].items():
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, float('infinity')):
+                distances[neighbor] = distance
+                previous[neighbor] = current_vertex
+                heapq.heappush(priority_queue, (distance + heuristic(neighbor, target), distance, neighbor))
+    
+    return float('infinity'), [], settled
+
+def _bidirectional(graph, reversed_graph, source, target):
+    """Bidirectional Dijkstra, alternating between the side with the smaller queue head"""
+    if source == target:
+        return 0, [source], 1
+    
+    graphs = (graph, reversed_graph)
+    distances = ({source: 0}, {target: 0})
+    previous = ({source: None}, {target: None})
+    queues = ([(0, source)], [(0, target)])
+    settled = 0
+    best = float('infinity')
+    meeting_vertex = None
+    
+    while queues[0] and queues[1]:
+        # Once both queue heads together reach the best path found, it is optimal
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        current_distance, current_vertex = heapq.heappop(queues[side])
+        if current_distance > distances[side][current_vertex]:
+            continue
+        settled += 1
+        
+        other_distances = distances[1 - side]
+        for neighbor, weight in graphs[side].get(current_vertex, {}).items():
+            distance = current_distance + weight
+            if distance < distances[side].get(neighbor, float('infinity')):
+                distances[side][neighbor] = distance
+                previous[side][neighbor] = current_vertex
+                heapq.heappush(queues[side], (distance, neighbor))
+            # Check whether the two searches meet through this edge
+            if neighbor in other_distances:
+                total = distances[side][neighbor] + other_distances[neighbor]
+                if total < best:
+                    best = total
+                    meeting_vertex = neighbor
+    
+    if meeting_vertex is None:
+        return float('infinity'), [], settled
+    
+    # Forward half from the source, backward half walks towards the target
+    path = get_path(previous[0], meeting_vertex)
+    current = previous[1][meeting_vertex]
+    while current is not None:
+        path.append(current)
+        current = previous[1][current]
+    return best, path, settled
+
 def main():
     # Create an example graph
     graph = {
@@ -89,6 +259,14 @@ def main():
         if vertex != start_vertex:
             path = get_path(previous, vertex)
             print(f"To {vertex}: distance = {distances[vertex]}, path = {' -> '.join(path)}")
+    print()
+    
+    # Point-to-point queries stop as soon as the target is settled
+    print("Point-to-point queries from A to C:")
+    for method in ('dijkstra', 'bidirectional'):
+        stats = {}
+        distance, path = shortest_path(graph, 'A', 'C', method=method, reversed_graph=graph, stats=stats)
+        print(f"{method}: distance = {distance}, path = {' -> '.join(path)}, settled = {stats['settled']}")
 
 if __name__ == "__main__":
     main()
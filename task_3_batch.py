@@ -0,0 +1,146 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from task_3_csr import CSRGraph, dijkstra_csr
+
+CSR_ARRAYS = ("offsets", "targets", "weights")
+
+# Per-process state set up by _init_worker
+_worker_graph = None
+_worker_blocks = []
+_worker_output = None
+
+
+class SharedCSR:
+    """
+    Copies the arrays of a CSRGraph into shared memory blocks once.
+
+    Workers attach to the blocks by name through spec, so the graph is never
+    pickled to them. Use as a context manager; the blocks are released on exit.
+    """
+    def __init__(self, graph):
+        self.blocks = []
+        self.spec = []
+        for name in CSR_ARRAYS:
+            array = getattr(graph, name)
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+            self.blocks.append(block)
+            self.spec.append((block.name, array.shape, array.dtype.str))
+
+    def close(self):
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _init_worker(spec, output_path=None):
+    """Attach to the shared graph (and the output file) once per worker process"""
+    global _worker_graph, _worker_output
+    arrays = []
+    for name, shape, dtype in spec:
+        block = shared_memory.SharedMemory(name=name)
+        _worker_blocks.append(block)
+        arrays.append(np.ndarray(shape, dtype=dtype, buffer=block.buf))
+    offsets, targets, weights = arrays
+    # Vertex numbers double as ids, so sources are passed as numbers
+    _worker_graph = CSRGraph(offsets, targets, weights, range(len(offsets) - 1))
+    if output_path is not None:
+        _worker_output = np.load(output_path, mmap_mode="r+")
+
+
+def _distance_row(source):
+    return dijkstra_csr(_worker_graph, source)[0]
+
+
+def _write_rows(task):
+    """Compute the rows of a block of sources straight into the output file"""
+    first_row, sources = task
+    for row, source in enumerate(sources, start=first_row):
+        _worker_output[row] = dijkstra_csr(_worker_graph, source)[0]
+    _worker_output.flush()
+    return first_row, len(sources)
+
+
+def distance_rows(graph, sources, workers=None, chunk_size=8):
+    """
+    Run Dijkstra from many sources in a process pool over a shared graph.
+
+    Yields (source, distances) pairs in the order of sources, where
+    distances is a float64 array indexed by vertex number. At most
+    workers * chunk_size sources are in flight at once, so undelivered rows
+    do not pile up, and closing the generator early cancels the rest.
+    """
+    workers = workers or os.cpu_count() or 1
+    window = workers * chunk_size
+    with SharedCSR(graph) as shared:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                       initargs=(shared.spec,))
+        try:
+            pending = deque()
+            for source in sources:
+                pending.append((source, executor.submit(_distance_row, graph.index[source])))
+                if len(pending) >= window:
+                    source, future = pending.popleft()
+                    yield source, future.result()
+            while pending:
+                source, future = pending.popleft()
+                yield source, future.result()
+        finally:
+            # Only rows already being computed are waited for
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def distance_matrix(graph, sources, out_path=None, workers=None, block_size=16):
+    """
+    Return the (len(sources), n) matrix of shortest distances.
+
+    With out_path the matrix is a .npy file opened as a memmap. Workers write
+    their rows into it directly, so rows never travel back through pipes.
+    """
+    sources = list(sources)
+    if out_path is None:
+        matrix = np.empty((len(sources), graph.num_vertices))
+        for row, (_, distances) in enumerate(distance_rows(graph, sources, workers)):
+            matrix[row] = distances
+        return matrix
+
+    matrix = np.lib.format.open_memmap(out_path, mode="w+", dtype=np.float64,
+                                       shape=(len(sources), graph.num_vertices))
+    matrix.flush()
+    numbers = [graph.index[source] for source in sources]
+    tasks = [(start, numbers[start:start + block_size]) for start in range(0, len(numbers), block_size)]
+    with SharedCSR(graph) as shared:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(shared.spec, out_path)) as executor:
+            for _ in executor.map(_write_rows, tasks):
+                pass
+    return np.load(out_path, mmap_mode="r")
+
+
+def main():
+    graph = {
+        'A': {'B': 6, 'D': 1},
+        'B': {'A': 6, 'C': 5, 'D': 2, 'E': 2},
+        'C': {'B': 5, 'E': 5},
+        'D': {'A': 1, 'B': 2, 'E': 1},
+        'E': {'B': 2, 'C': 5, 'D': 1}
+    }
+    csr = CSRGraph.from_dict(graph)
+    print(f"Distance matrix ({', '.join(csr.vertices)}):")
+    for source, distances in distance_rows(csr, csr.vertices, workers=os.cpu_count()):
+        print(f"{source}: {distances.tolist()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+import os
+import struct
+import tempfile
+
+import numpy as np
+
+from task_3_csr import CSRGraph, dijkstra_csr, get_path_csr
+
+MAGIC = b"CSRGRAPH"
+FORMAT_VERSION = 1
+HAS_NAMES = 1  # Header flag: a names section follows the weights
+# magic, version, flags, vertices, edges, offsets/targets/weights/names positions
+HEADER = struct.Struct("<8sIIQQQQQQ")
+OFFSET_DTYPE = np.dtype("<i8")
+TARGET_DTYPE = np.dtype("<i4")
+WEIGHT_DTYPE = np.dtype("<f8")
+CHUNK_LINES = 1 << 16
+
+
+def _align(position):
+    """Round a file position up to a multiple of 8 bytes"""
+    return (position + 7) & ~7
+
+
+def _layout(num_vertices, num_edges, names):
+    """Return the header fields after magic/version/flags and the total file size"""
+    names_size = 0 if names is None else len(names)
+    offsets_pos = _align(HEADER.size)
+    targets_pos = _align(offsets_pos + (num_vertices + 1) * OFFSET_DTYPE.itemsize)
+    weights_pos = _align(targets_pos + num_edges * TARGET_DTYPE.itemsize)
+    names_pos = _align(weights_pos + num_edges * WEIGHT_DTYPE.itemsize)
+    end = names_pos + names_size
+    return (num_vertices, num_edges, offsets_pos, targets_pos, weights_pos,
+            0 if names is None else names_pos), end
+
+
+def _names_section(vertices):
+    """Encode vertex ids as newline-separated UTF-8, or return None when they are just 0..n-1"""
+    if isinstance(vertices, range) and vertices.start == 0 and vertices.step == 1:
+        return None
+    if all(isinstance(vertex, (int, np.integer)) and not isinstance(vertex, bool) and vertex == i
+           for i, vertex in enumerate(vertices)):
+        return None
+    return "\n".join(map(str, vertices)).encode("utf-8")
+
+
+def _write_header(f, fields, names):
+    f.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0 if names is None else HAS_NAMES, *fields))
+
+
+def save_graph(graph, path):
+    """
+    Write a CSRGraph to the binary format.
+
+    Layout: a fixed header, then 8-byte aligned offset (int64), target (int32)
+    and weight (float64) sections in little-endian order, then the vertex ids
+    as newline-separated text unless they are simply 0..n-1. Ids are stored
+    as strings.
+    """
+    names = _names_section(graph.vertices)
+    fields, end = _layout(graph.num_vertices, graph.num_edges, names)
+    with open(path, "wb") as f:
+        _write_header(f, fields, names)
+        for position, array, dtype in zip(fields[2:5], (graph.offsets, graph.targets, graph.weights),
+                                          (OFFSET_DTYPE, TARGET_DTYPE, WEIGHT_DTYPE)):
+            f.seek(position)
+            f.write(np.ascontiguousarray(array, dtype=dtype).tobytes())
+        if names is not None:
+            f.seek(fields[5])
+            f.write(names)
+        f.truncate(end)
+
+
+def load_graph(path):
+    """
+    Memory-map a graph file written by save_graph or convert_edge_list.
+
+    Only the header (and the vertex names, if any) are read up front; the
+    arrays are paged in by the operating system as Dijkstra touches them.
+    """
+    with open(path, "rb") as f:
+        header = f.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"{path} is too short to be a graph file")
+        magic, version, flags, num_vertices, num_edges, offsets_pos, targets_pos, weights_pos, names_pos = \
+            HEADER.unpack(header)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} graph file")
+        if flags & HAS_NAMES:
+            f.seek(names_pos)
+            vertices = f.read().decode("utf-8").split("\n")
+        else:
+            vertices = range(num_vertices)
+
+    def section(position, dtype, count):
+        if count == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="r", offset=position, shape=(count,))
+
+    return CSRGraph(
+        section(offsets_pos, OFFSET_DTYPE, num_vertices + 1),
+        section(targets_pos, TARGET_DTYPE, num_edges),
+        section(weights_pos, WEIGHT_DTYPE, num_edges),
+        vertices,
+    )
+
+
+def _read_edges(path, delimiter, default_weight):
+    """Yield lists of (source, target, weight) string triples, CHUNK_LINES lines at a time"""
+    chunk = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            fields = line.split(delimiter)
+            if len(fields) == 2:
+                fields.append(default_weight)
+            elif len(fields) != 3:
+                raise ValueError(f"Expected 'source target [weight]', got: {line!r}")
+            chunk.append(fields)
+            if len(chunk) == CHUNK_LINES:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def convert_edge_list(text_path, out_path, directed=True, delimiter=None,
+                      numeric_ids=False, default_weight="1"):
+    """
+    Convert a 'source target [weight]' text file (CSV with delimiter=',') to the binary format.
+
+    The input is streamed twice: the first pass numbers the vertices and
+    counts out-degrees, the second writes targets and weights straight into
+    the memory-mapped output. Lines starting with '#' are skipped. With
+    numeric_ids the ids must be integers 0..n-1 and no names are stored.
+    """
+    index = {}
+    vertices = []
+    degrees = np.zeros(0, dtype=np.int64)
+
+    def numbers(ids):
+        if numeric_ids:
+            return np.array(ids, dtype=np.int64)
+        result = np.empty(len(ids), dtype=np.int64)
+        for i, vertex in enumerate(ids):
+            number = index.get(vertex)
+            if number is None:
+                number = index[vertex] = len(vertices)
+                vertices.append(vertex)
+            result[i] = number
+        return result
+
+    def directed_chunk(chunk):
+        sources = numbers([fields[0] for fields in chunk])
+        targets = numbers([fields[1] for fields in chunk])
+        weights = np.array([fields[2] for fields in chunk], dtype=np.float64)
+        if not directed:
+            sources, targets = np.concatenate((sources, targets)), np.concatenate((targets, sources))
+            weights = np.concatenate((weights, weights))
+        return sources, targets, weights
+
+    # Pass 1: vertex numbering and out-degrees
+    num_vertices = 0
+    for chunk in _read_edges(text_path, delimiter, default_weight):
+        sources, targets, _ = directed_chunk(chunk)
+        num_vertices = max(num_vertices, len(vertices),
+                           int(sources.max()) + 1, int(targets.max()) + 1)
+        counts = np.bincount(sources, minlength=num_vertices)
+        counts[:len(degrees)] += degrees
+        degrees = counts
+
+    degrees = np.pad(degrees, (0, num_vertices - len(degrees)))
+    offsets = np.zeros(num_vertices + 1, dtype=np.int64)
+    np.cumsum(degrees, out=offsets[1:])
+    num_edges = int(offsets[-1])
+
+    names = None if numeric_ids else _names_section(vertices)
+    fields, end = _layout(num_vertices, num_edges, names)
+    with open(out_path, "wb") as f:
+        _write_header(f, fields, names)
+        f.seek(fields[2])
+        f.write(offsets.astype(OFFSET_DTYPE).tobytes())
+        if names is not None:
+            f.seek(fields[5])
+            f.write(names)
+        f.truncate(end)
+    if num_edges == 0:
+        return
+
+    # Pass 2: place every edge at the next free slot of its source
+    out_targets = np.memmap(out_path, dtype=TARGET_DTYPE, mode="r+", offset=fields[3], shape=(num_edges,))
+    out_weights = np.memmap(out_path, dtype=WEIGHT_DTYPE, mode="r+", offset=fields[4], shape=(num_edges,))
+    cursor = offsets[:-1].copy()
+    for chunk in _read_edges(text_path, delimiter, default_weight):
+        sources, targets, weights = directed_chunk(chunk)
+        order = np.argsort(sources, kind="stable")
+        sources = sources[order]
+        group_sources, group_starts, group_counts = np.unique(sources, return_index=True, return_counts=True)
+        rank_in_group = np.arange(len(sources)) - np.repeat(group_starts, group_counts)
+        positions = cursor[sources] + rank_in_group
+        out_targets[positions] = targets[order]
+        out_weights[positions] = weights[order]
+        cursor[group_sources] += group_counts
+    out_targets.flush()
+    out_weights.flush()
+
+
+def main():
+    edges = [
+        "# source target weight",
+        "A B 6", "A D 1",
+        "B C 5", "B D 2", "B E 2",
+        "C E 5",
+        "D E 1",
+    ]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        text_path = os.path.join(tmp_dir, "graph.txt")
+        graph_path = os.path.join(tmp_dir, "graph.bin")
+        with open(text_path, "w") as f:
+            f.write("\n".join(edges) + "\n")
+
+        convert_edge_list(text_path, graph_path, directed=False)
+        graph = load_graph(graph_path)
+        print(f"Loaded {graph.num_vertices} vertices and {graph.num_edges} edges "
+              f"from a {os.path.getsize(graph_path)} byte file")
+
+        start_vertex = 'A'
+        distances, previous = dijkstra_csr(graph, start_vertex)
+        print(f"Shortest paths from vertex {start_vertex}:")
+        for vertex in sorted(graph.vertices):
+            if vertex != start_vertex:
+                path = get_path_csr(graph, previous, vertex)
+                print(f"To {vertex}: distance = {distances[graph.index[vertex]]}, path = {' -> '.join(path)}")
+        del graph, distances, previous
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+import sys
+from collections import OrderedDict
+
+from task_3 import dijkstra, get_path
+
+
+def tree_bytes(distances, previous):
+    """Approximate memory held by a (distances, previous) pair of dictionaries"""
+    # Distances are mostly distinct float objects; vertices and previous values are shared
+    return sys.getsizeof(distances) + sys.getsizeof(previous) + 24 * len(distances)
+
+
+class ShortestPathCache:
+    """
+    Caches shortest-path trees per source over a graph that can change.
+
+    Trees are evicted in least-recently-used order once their estimated size
+    exceeds max_bytes. Graph changes must go through set_edge/remove_edge so
+    cached trees can be invalidated:
+
+    'precise' -- drop only the trees the change affects: a longer or removed
+                 edge matters only if it is a tree edge, a shorter or new edge
+                 only if it shortens the distance to its head
+    'version' -- every change bumps a version counter and makes all older
+                 trees stale
+    """
+    def __init__(self, graph, max_bytes=64 * 2**20, invalidation='precise'):
+        if invalidation not in ('precise', 'version'):
+            raise ValueError(f"Unknown invalidation mode: {invalidation}")
+        self.graph = graph
+        self.max_bytes = max_bytes
+        self.invalidation = invalidation
+        self.version = 0
+        self.entries = OrderedDict()  # start -> (distances, previous, size, version)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def dijkstra(self, start):
+        """Same result as task_3.dijkstra(graph, start); do not modify the returned dictionaries"""
+        entry = self.entries.get(start)
+        if entry is not None and entry[3] == self.version:
+            self.hits += 1
+            self.entries.move_to_end(start)
+            return entry[0], entry[1]
+        if entry is not None:
+            self._drop(start)
+            self.invalidations += 1
+
+        self.misses += 1
+        distances, previous = dijkstra(self.graph, start)
+        size = tree_bytes(distances, previous)
+        self.entries[start] = (distances, previous, size, self.version)
+        self.bytes += size
+        while self.bytes > self.max_bytes and len(self.entries) > 1:
+            self._drop(next(iter(self.entries)))
+            self.evictions += 1
+        return distances, previous
+
+    def get_path(self, start, target):
+        """Shortest path from start to target in the format of task_3.get_path"""
+        return get_path(self.dijkstra(start)[1], target)
+
+    def set_edge(self, u, v, weight):
+        """Insert the edge u -> v or change its weight"""
+        new_vertices = [vertex for vertex in dict.fromkeys((u, v)) if vertex not in self.graph]
+        old = self.graph.setdefault(u, {}).get(v)
+        self.graph.setdefault(v, {})
+        self.graph[u][v] = weight
+        if new_vertices and self.invalidation == 'precise':
+            self._add_vertices(new_vertices)
+        if old is None or weight < old:
+            self._invalidate(lambda distances, previous: (
+                distances.get(u, float('infinity')) + weight < distances.get(v, float('infinity'))
+            ))
+        elif weight > old:
+            self._invalidate(lambda distances, previous: previous.get(v) == u)
+
+    def remove_edge(self, u, v):
+        """Delete the edge u -> v"""
+        del self.graph[u][v]
+        self._invalidate(lambda distances, previous: previous.get(v) == u)
+
+    def stats(self):
+        """Return hit/miss counters and the current cache size"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'entries': len(self.entries),
+            'bytes': self.bytes,
+        }
+
+    def _add_vertices(self, vertices):
+        """Give every cached tree an unreachable entry for each new vertex, as dijkstra would"""
+        for start, (distances, previous, size, version) in self.entries.items():
+            for vertex in vertices:
+                distances[vertex] = float('infinity')
+                previous[vertex] = None
+            new_size = tree_bytes(distances, previous)
+            self.entries[start] = (distances, previous, new_size, version)
+            self.bytes += new_size - size
+
+    def _invalidate(self, is_affected):
+        if self.invalidation == 'version':
+            # Stale entries are dropped lazily on their next lookup
+            self.version += 1
+            return
+        for start in [start for start, entry in self.entries.items() if is_affected(entry[0], entry[1])]:
+            self._drop(start)
+            self.invalidations += 1
+
+    def _drop(self, start):
+        self.bytes -= self.entries.pop(start)[2]
+
+
+def main():
+    graph = {
+        'A': {'B': 6, 'D': 1},
+        'B': {'A': 6, 'C': 5, 'D': 2, 'E': 2},
+        'C': {'B': 5, 'E': 5},
+        'D': {'A': 1, 'B': 2, 'E': 1},
+        'E': {'B': 2, 'C': 5, 'D': 1}
+    }
+    cache = ShortestPathCache(graph)
+    for start, target in [('A', 'C'), ('A', 'E'), ('B', 'C'), ('A', 'C')]:
+        print(f"{start} -> {target}: {' -> '.join(cache.get_path(start, target))}")
+
+    # D -> A is a tree edge from B but not from A, so only the tree from B is dropped
+    cache.set_edge('D', 'A', 5)
+    print("After D -> A becomes 5:")
+    for start, target in [('A', 'C'), ('B', 'A')]:
+        print(f"{start} -> {target}: {' -> '.join(cache.get_path(start, target))}")
+    print(f"Cache statistics: {cache.stats()}")
+
+if __name__ == "__main__":
+    main()
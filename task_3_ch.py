@@ -0,0 +1,289 @@
+import heapq
+import json
+import os
+
+import numpy as np
+
+from task_3_csr import CSRGraph
+
+NO_MIDDLE = -1  # Middle vertex of an original (non-shortcut) edge
+ARRAYS = (
+    "rank",
+    "up_offsets", "up_targets", "up_weights", "up_middle",
+    "down_offsets", "down_targets", "down_weights", "down_middle",
+)
+
+
+class ContractionHierarchy:
+    """
+    Contraction-hierarchy index for repeated shortest-path queries.
+
+    Every vertex has a rank. The upward graph holds edges u -> w with
+    rank[w] > rank[u]; the downward graph holds edges u -> w with
+    rank[u] > rank[w], stored at w pointing back to u. Both are CSR arrays;
+    *_middle is the contracted vertex a shortcut bypasses, NO_MIDDLE for
+    original edges.
+    """
+    def __init__(self, vertices, **arrays):
+        self.vertices = list(vertices)
+        self.index = {vertex: i for i, vertex in enumerate(self.vertices)}
+        for name in ARRAYS:
+            setattr(self, name, arrays[name])
+
+    @classmethod
+    def build(cls, graph, witness_limit=64):
+        """
+        Contract the vertices of a CSRGraph (or adjacency dict) one by one.
+
+        Vertices are picked by edge difference with lazy updates. A shortcut
+        u -> w is added only when a local witness search from u, settling at
+        most witness_limit vertices, finds no path as short without v.
+        """
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_dict(graph)
+        n = graph.num_vertices
+
+        # Remaining (uncontracted) graph in both directions, plus every edge ever seen
+        out_edges = [{} for _ in range(n)]
+        in_edges = [{} for _ in range(n)]
+        edges = {}
+        for u in range(n):
+            targets, weights = graph.neighbors(u)
+            for w, weight in zip(targets.tolist(), weights.tolist()):
+                if u != w and weight < out_edges[u].get(w, float('infinity')):
+                    out_edges[u][w] = weight
+                    in_edges[w][u] = weight
+                    edges[(u, w)] = (weight, NO_MIDDLE)
+
+        contracted_neighbors = [0] * n
+        rank = np.empty(n, dtype=np.int32)
+
+        def shortcuts(v):
+            """Return the shortcuts needed to contract v as (u, w, weight) tuples"""
+            needed = []
+            outgoing = out_edges[v]
+            if not outgoing:
+                return needed
+            max_out = max(outgoing.values())
+            for u, weight_in in in_edges[v].items():
+                limit = weight_in + max_out
+                witness = _witness_search(out_edges, u, v, limit, witness_limit)
+                for w, weight_out in outgoing.items():
+                    if w == u:
+                        continue
+                    weight = weight_in + weight_out
+                    if witness.get(w, float('infinity')) > weight:
+                        needed.append((u, w, weight))
+            return needed
+
+        def priority(v, needed):
+            """Edge difference plus the number of already contracted neighbors"""
+            return len(needed) - len(in_edges[v]) - len(out_edges[v]) + contracted_neighbors[v]
+
+        queue = [(priority(v, shortcuts(v)), v) for v in range(n)]
+        heapq.heapify(queue)
+        order = 0
+        while queue:
+            _, v = heapq.heappop(queue)
+            # Lazy update: re-check the priority before contracting
+            needed = shortcuts(v)
+            current = priority(v, needed)
+            if queue and current > queue[0][0]:
+                heapq.heappush(queue, (current, v))
+                continue
+
+            for u, w, weight in needed:
+                if weight < out_edges[u].get(w, float('infinity')):
+                    out_edges[u][w] = weight
+                    in_edges[w][u] = weight
+                    edges[(u, w)] = (weight, v)
+
+            for u in in_edges[v]:
+                del out_edges[u][v]
+                contracted_neighbors[u] += 1
+            for w in out_edges[v]:
+                del in_edges[w][v]
+                contracted_neighbors[w] += 1
+            out_edges[v] = {}
+            in_edges[v] = {}
+            rank[v] = order
+            order += 1
+
+        return cls(graph.vertices, rank=rank, **_split_edges(edges, rank, n))
+
+    def save(self, path):
+        """Write the index to a directory of .npy files plus vertices.json"""
+        os.makedirs(path, exist_ok=True)
+        for name in ARRAYS:
+            np.save(os.path.join(path, f"{name}.npy"), getattr(self, name))
+        with open(os.path.join(path, "vertices.json"), "w") as f:
+            json.dump(self.vertices, f)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """Load an index written by save, memory-mapping the arrays by default"""
+        mode = "r" if mmap else None
+        arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mode) for name in ARRAYS}
+        with open(os.path.join(path, "vertices.json")) as f:
+            # JSON turns tuples into lists, turn them back into hashable ids
+            vertices = [tuple(v) if isinstance(v, list) else v for v in json.load(f)]
+        return cls(vertices, **arrays)
+
+    def _search(self, source, target):
+        """Bidirectional upward search, returns (distance, meeting vertex, previous maps)"""
+        graphs = (
+            (memoryview(self.up_offsets), memoryview(self.up_targets), memoryview(self.up_weights)),
+            (memoryview(self.down_offsets), memoryview(self.down_targets), memoryview(self.down_weights)),
+        )
+        distances = ({source: 0.0}, {target: 0.0})
+        previous = ({source: None}, {target: None})
+        queues = ([(0.0, source)], [(0.0, target)])
+        best = 0.0 if source == target else float('infinity')
+        meeting_vertex = source if source == target else None
+
+        # Each side may stop once its queue head cannot improve the best distance
+        while (queues[0] and queues[0][0][0] < best) or (queues[1] and queues[1][0][0] < best):
+            side = 0 if queues[0] and (not queues[1] or queues[0][0][0] <= queues[1][0][0]) else 1
+            current_distance, current_vertex = heapq.heappop(queues[side])
+            if current_distance > distances[side][current_vertex]:
+                continue
+            other = distances[1 - side].get(current_vertex)
+            if other is not None and current_distance + other < best:
+                best = current_distance + other
+                meeting_vertex = current_vertex
+
+            offsets, targets, weights = graphs[side]
+            for k in range(offsets[current_vertex], offsets[current_vertex + 1]):
+                neighbor = targets[k]
+                distance = current_distance + weights[k]
+                if distance < distances[side].get(neighbor, float('infinity')):
+                    distances[side][neighbor] = distance
+                    previous[side][neighbor] = current_vertex
+                    heapq.heappush(queues[side], (distance, neighbor))
+        return best, meeting_vertex, previous
+
+    def distance(self, source, target):
+        """Return the shortest distance from source to target (infinity if unreachable)"""
+        return self._search(self.index[source], self.index[target])[0]
+
+    def shortest_path(self, source, target):
+        """
+        Return (distance, path) with the path in the vertex-list format of task_3.get_path.
+
+        The path is empty when the target is unreachable.
+        """
+        distance, meeting_vertex, previous = self._search(self.index[source], self.index[target])
+        if meeting_vertex is None:
+            return distance, []
+
+        # Hierarchy path: source up to the meeting vertex, then down to the target
+        hops = []
+        current = meeting_vertex
+        while current is not None:
+            hops.append(current)
+            current = previous[0][current]
+        hops.reverse()
+        current = previous[1][meeting_vertex]
+        while current is not None:
+            hops.append(current)
+            current = previous[1][current]
+
+        path = [hops[0]]
+        for u, w in zip(hops, hops[1:]):
+            path.extend(self._unpack(u, w))
+        return distance, [self.vertices[v] for v in path]
+
+    def _edge_middle(self, u, w):
+        """Middle vertex of the hierarchy edge u -> w"""
+        if self.rank[u] < self.rank[w]:
+            offsets, targets, middle, key, other = self.up_offsets, self.up_targets, self.up_middle, u, w
+        else:
+            offsets, targets, middle, key, other = self.down_offsets, self.down_targets, self.down_middle, w, u
+        start, end = offsets[key], offsets[key + 1]
+        k = start + int(np.flatnonzero(targets[start:end] == other)[0])
+        return int(middle[k])
+
+    def _unpack(self, u, w):
+        """Expand the hierarchy edge u -> w into original vertices, excluding u"""
+        expanded = []
+        stack = [(u, w)]
+        while stack:
+            a, b = stack.pop()
+            middle = self._edge_middle(a, b)
+            if middle == NO_MIDDLE:
+                expanded.append(b)
+            else:
+                # Push the second half first so the first half is expanded first
+                stack.append((middle, b))
+                stack.append((a, middle))
+        return expanded
+
+
+def _witness_search(out_edges, source, excluded, limit, max_settled):
+    """Local Dijkstra from source that ignores excluded and stops past limit"""
+    distances = {source: 0}
+    queue = [(0, source)]
+    settled = 0
+    while queue and settled < max_settled:
+        current_distance, current_vertex = heapq.heappop(queue)
+        if current_distance > distances[current_vertex]:
+            continue
+        if current_distance > limit:
+            break
+        settled += 1
+        for neighbor, weight in out_edges[current_vertex].items():
+            if neighbor == excluded:
+                continue
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, float('infinity')):
+                distances[neighbor] = distance
+                heapq.heappush(queue, (distance, neighbor))
+    return distances
+
+
+def _split_edges(edges, rank, n):
+    """Build the upward and downward CSR arrays from {(u, w): (weight, middle)}"""
+    pairs = np.array(list(edges.keys()), dtype=np.int64).reshape(-1, 2)
+    values = list(edges.values())
+    weights = np.array([weight for weight, _ in values], dtype=np.float64)
+    middles = np.array([middle for _, middle in values], dtype=np.int32)
+    sources, targets = pairs[:, 0], pairs[:, 1]
+
+    arrays = {}
+    upward = rank[sources] < rank[targets]
+    # Downward edges are stored at their lower-ranked end, pointing back up
+    for prefix, mask, keys, others in (
+        ("up", upward, sources, targets),
+        ("down", ~upward, targets, sources),
+    ):
+        keys = keys[mask]
+        order = np.argsort(keys, kind="stable")
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(keys, minlength=n), out=offsets[1:])
+        arrays[f"{prefix}_offsets"] = offsets
+        arrays[f"{prefix}_targets"] = others[mask][order].astype(np.int32)
+        arrays[f"{prefix}_weights"] = weights[mask][order]
+        arrays[f"{prefix}_middle"] = middles[mask][order]
+    return arrays
+
+
+def main():
+    graph = {
+        'A': {'B': 6, 'D': 1},
+        'B': {'A': 6, 'C': 5, 'D': 2, 'E': 2},
+        'C': {'B': 5, 'E': 5},
+        'D': {'A': 1, 'B': 2, 'E': 1},
+        'E': {'B': 2, 'C': 5, 'D': 1}
+    }
+    hierarchy = ContractionHierarchy.build(graph)
+    print("Contraction order:", [hierarchy.vertices[v] for v in np.argsort(hierarchy.rank)])
+
+    start_vertex = 'A'
+    print(f"Shortest paths from vertex {start_vertex}:")
+    for vertex in sorted(graph.keys()):
+        if vertex != start_vertex:
+            distance, path = hierarchy.shortest_path(start_vertex, vertex)
+            print(f"To {vertex}: distance = {distance}, path = {' -> '.join(path)}")
+
+if __name__ == "__main__":
+    main()
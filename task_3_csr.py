@@ -0,0 +1,217 @@
+import heapq
+from functools import cached_property
+
+import numpy as np
+
+NO_VERTEX = -1  # Marks "no previous vertex" in previous arrays
+
+
+class RangeIndex:
+    """Identity mapping for graphs whose vertex ids are the numbers 0..n-1"""
+    def __init__(self, n):
+        self.n = n
+
+    def __getitem__(self, vertex):
+        if isinstance(vertex, (int, np.integer)) and 0 <= vertex < self.n:
+            return int(vertex)
+        raise KeyError(vertex)
+
+    def __contains__(self, vertex):
+        return isinstance(vertex, (int, np.integer)) and 0 <= vertex < self.n
+
+    def __len__(self):
+        return self.n
+
+
+class CSRGraph:
+    """
+    Directed weighted graph in compressed sparse row form.
+
+    The out-edges of vertex i are targets[offsets[i]:offsets[i + 1]] with the
+    matching weights. Vertices are numbered 0..n-1; vertices[i] is the
+    original id of vertex i and index maps ids back to numbers. When
+    vertices is a range the ids are the numbers themselves and no mapping
+    is built.
+    """
+    def __init__(self, offsets, targets, weights, vertices):
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.vertices = vertices if isinstance(vertices, range) else list(vertices)
+
+    @cached_property
+    def index(self):
+        if isinstance(self.vertices, range) and self.vertices.start == 0 and self.vertices.step == 1:
+            return RangeIndex(len(self.vertices))
+        return {vertex: i for i, vertex in enumerate(self.vertices)}
+
+    @classmethod
+    def from_dict(cls, graph):
+        """Build from the adjacency dictionary format used by task_3.dijkstra"""
+        vertices = list(graph)
+        known = set(vertices)
+        for edges in graph.values():
+            for neighbor in edges:
+                if neighbor not in known:
+                    known.add(neighbor)
+                    vertices.append(neighbor)
+        index = {vertex: i for i, vertex in enumerate(vertices)}
+
+        degrees = np.zeros(len(vertices) + 1, dtype=np.int64)
+        for vertex, edges in graph.items():
+            degrees[index[vertex] + 1] = len(edges)
+        offsets = np.cumsum(degrees)
+
+        targets = np.empty(offsets[-1], dtype=np.int32)
+        weights = np.empty(offsets[-1], dtype=np.float64)
+        for vertex, edges in graph.items():
+            start = offsets[index[vertex]]
+            end = start + len(edges)
+            targets[start:end] = [index[neighbor] for neighbor in edges]
+            weights[start:end] = list(edges.values())
+        return cls(offsets, targets, weights, vertices)
+
+    @classmethod
+    def from_edges(cls, edges, vertices=None, directed=True):
+        """
+        Build from an iterable of (source, target, weight) tuples.
+
+        vertices fixes the vertex order and may list isolated vertices; by
+        default vertices are numbered in order of first appearance. Undirected
+        graphs store every edge in both directions.
+        """
+        vertices = list(vertices) if vertices is not None else []
+        index = {vertex: i for i, vertex in enumerate(vertices)}
+        sources = []
+        targets = []
+        weights = []
+        for source, target, weight in edges:
+            for vertex in (source, target):
+                if vertex not in index:
+                    index[vertex] = len(vertices)
+                    vertices.append(vertex)
+            sources.append(index[source])
+            targets.append(index[target])
+            weights.append(weight)
+
+        sources = np.array(sources, dtype=np.int64)
+        targets = np.array(targets, dtype=np.int64)
+        weights = np.array(weights, dtype=np.float64)
+        if not directed:
+            sources, targets = np.concatenate((sources, targets)), np.concatenate((targets, sources))
+            weights = np.concatenate((weights, weights))
+        return cls.from_arrays(sources, targets, weights, vertices)
+
+    @classmethod
+    def from_arrays(cls, sources, targets, weights, vertices):
+        """Build from parallel edge arrays with sources and targets as vertex numbers"""
+        order = np.argsort(sources, kind="stable")
+        offsets = np.zeros(len(vertices) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=len(vertices)), out=offsets[1:])
+        return cls(offsets, np.asarray(targets, dtype=np.int32)[order],
+                   np.asarray(weights, dtype=np.float64)[order], vertices)
+
+    @property
+    def num_vertices(self):
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    @property
+    def nbytes(self):
+        """Bytes used by the offset, target and weight arrays"""
+        return self.offsets.nbytes + self.targets.nbytes + self.weights.nbytes
+
+    def neighbors(self, i):
+        """Return the (targets, weights) arrays of the out-edges of vertex number i"""
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return self.targets[start:end], self.weights[start:end]
+
+    def to_dict(self):
+        """Convert back to the adjacency dictionary format"""
+        graph = {}
+        for i, vertex in enumerate(self.vertices):
+            targets, weights = self.neighbors(i)
+            graph[vertex] = {self.vertices[t]: w for t, w in zip(targets.tolist(), weights.tolist())}
+        return graph
+
+
+def dijkstra_csr(graph, start):
+    """
+    Dijkstra's algorithm over a CSRGraph.
+
+    Arguments:
+    graph -- CSRGraph
+    start -- starting vertex (original id)
+
+    Returns:
+    distances -- float64 array of shortest distances indexed by vertex number
+    previous -- int64 array of previous vertex numbers, NO_VERTEX when there is none
+    """
+    n = graph.num_vertices
+    # memoryviews index into the arrays without creating NumPy scalars
+    offsets = memoryview(graph.offsets)
+    targets = memoryview(graph.targets)
+    weights = memoryview(graph.weights)
+    distances = [float('infinity')] * n
+    previous = [NO_VERTEX] * n
+
+    source = graph.index[start]
+    distances[source] = 0.0
+    priority_queue = [(0.0, source)]
+
+    while priority_queue:
+        current_distance, current_vertex = heapq.heappop(priority_queue)
+        if current_distance > distances[current_vertex]:
+            continue
+
+        for k in range(offsets[current_vertex], offsets[current_vertex + 1]):
+            neighbor = targets[k]
+            distance = current_distance + weights[k]
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                previous[neighbor] = current_vertex
+                heapq.heappush(priority_queue, (distance, neighbor))
+
+    return np.array(distances), np.array(previous, dtype=np.int64)
+
+
+def get_path_csr(graph, previous, target):
+    """
+    Reconstructs the path to target from a previous array, as original vertex ids.
+    """
+    path = []
+    current = graph.index[target]
+    while current != NO_VERTEX:
+        path.append(graph.vertices[current])
+        current = int(previous[current])
+    return path[::-1]
+
+
+def main():
+    graph = {
+        'A': {'B': 6, 'D': 1},
+        'B': {'A': 6, 'C': 5, 'D': 2, 'E': 2},
+        'C': {'B': 5, 'E': 5},
+        'D': {'A': 1, 'B': 2, 'E': 1},
+        'E': {'B': 2, 'C': 5, 'D': 1}
+    }
+    csr = CSRGraph.from_dict(graph)
+    print(f"CSR graph: {csr.num_vertices} vertices, {csr.num_edges} edges, {csr.nbytes} bytes")
+    print(f"offsets = {csr.offsets.tolist()}")
+    print(f"targets = {csr.targets.tolist()}")
+    print(f"weights = {csr.weights.tolist()}")
+    print()
+
+    start_vertex = 'A'
+    distances, previous = dijkstra_csr(csr, start_vertex)
+    print(f"Shortest paths from vertex {start_vertex}:")
+    for vertex in sorted(csr.vertices):
+        if vertex != start_vertex:
+            path = get_path_csr(csr, previous, vertex)
+            print(f"To {vertex}: distance = {distances[csr.index[vertex]]}, path = {' -> '.join(path)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+import heapq
+
+from task_3 import dijkstra, get_path, reverse_graph
+
+
+class DynamicShortestPathTree:
+    """
+    Single-source shortest-path tree that is repaired after every edge update.
+
+    distances and previous have the same format as the results of
+    task_3.dijkstra. Updates follow Ramalingam and Reps: a cheaper edge
+    starts a Dijkstra search from its head that only spreads while distances
+    improve, and a more expensive or removed tree edge invalidates its
+    subtree, which is then rebuilt from the unaffected vertices around it.
+    The graph is modified in place.
+    """
+    def __init__(self, graph, start):
+        self.graph = graph
+        self.start = start
+        self.incoming = reverse_graph(graph)
+        self.distances, self.previous = dijkstra(graph, start)
+        self.children = {vertex: set() for vertex in self.distances}
+        for vertex, parent in self.previous.items():
+            if parent is not None:
+                self.children[parent].add(vertex)
+
+    def _add_vertex(self, vertex):
+        if vertex not in self.distances:
+            self.graph.setdefault(vertex, {})
+            self.incoming.setdefault(vertex, {})
+            self.distances[vertex] = float('infinity')
+            self.previous[vertex] = None
+            self.children[vertex] = set()
+
+    def _set_parent(self, vertex, parent):
+        old = self.previous[vertex]
+        if old is not None:
+            self.children[old].discard(vertex)
+        self.previous[vertex] = parent
+        if parent is not None:
+            self.children[parent].add(vertex)
+
+    def set_edge(self, u, v, weight):
+        """
+        Insert the edge u -> v or change its weight.
+
+        Returns the number of vertices whose tree entry was recomputed.
+        """
+        self._add_vertex(u)
+        self._add_vertex(v)
+        old = self.graph[u].get(v)
+        self.graph[u][v] = weight
+        self.incoming[v][u] = weight
+
+        if old is None or weight < old:
+            return self._decrease(u, v, weight)
+        if weight > old and self.previous[v] == u:
+            return self._increase(v)
+        return 0
+
+    def remove_edge(self, u, v):
+        """
+        Delete the edge u -> v.
+
+        Returns the number of vertices whose tree entry was recomputed.
+        """
+        del self.graph[u][v]
+        del self.incoming[v][u]
+        if self.previous[v] == u:
+            return self._increase(v)
+        return 0
+
+    def get_path(self, target):
+        """Path from the start vertex to target in the format of task_3.get_path"""
+        return get_path(self.previous, target)
+
+    def _decrease(self, u, v, weight):
+        """Propagate a shorter distance to v through u -> v"""
+        distance = self.distances[u] + weight
+        if distance >= self.distances[v]:
+            return 0
+        self.distances[v] = distance
+        self._set_parent(v, u)
+        return self._propagate([(distance, v)])
+
+    def _propagate(self, priority_queue):
+        """Dijkstra from the queued vertices, only following improvements"""
+        heapq.heapify(priority_queue)
+        processed = 0
+        while priority_queue:
+            current_distance, current_vertex = heapq.heappop(priority_queue)
+            if current_distance > self.distances[current_vertex]:
+                continue
+            processed += 1
+            for neighbor, weight in self.graph[current_vertex].items():
+                distance = current_distance + weight
+                if distance < self.distances[neighbor]:
+                    self.distances[neighbor] = distance
+                    self._set_parent(neighbor, current_vertex)
+                    heapq.heappush(priority_queue, (distance, neighbor))
+        return processed
+
+    def _increase(self, v):
+        """Recompute the subtree of v after its tree edge got longer or vanished"""
+        # Every vertex whose tree path runs through v may get longer
+        affected = {v}
+        stack = [v]
+        while stack:
+            for child in self.children[stack.pop()]:
+                affected.add(child)
+                stack.append(child)
+
+        for vertex in affected:
+            self.distances[vertex] = float('infinity')
+            self._set_parent(vertex, None)
+
+        # Best way into each affected vertex from the unaffected part of the tree
+        priority_queue = []
+        for vertex in affected:
+            best = float('infinity')
+            best_parent = None
+            for parent, weight in self.incoming[vertex].items():
+                if parent not in affected and self.distances[parent] + weight < best:
+                    best = self.distances[parent] + weight
+                    best_parent = parent
+            if best_parent is not None:
+                self.distances[vertex] = best
+                self._set_parent(vertex, best_parent)
+                priority_queue.append((best, vertex))
+
+        self._propagate(priority_queue)
+        return len(affected)
+
+
+def main():
+    graph = {
+        'A': {'B': 6, 'D': 1},
+        'B': {'A': 6, 'C': 5, 'D': 2, 'E': 2},
+        'C': {'B': 5, 'E': 5},
+        'D': {'A': 1, 'B': 2, 'E': 1},
+        'E': {'B': 2, 'C': 5, 'D': 1}
+    }
+    tree = DynamicShortestPathTree(graph, 'A')
+
+    def show(title):
+        print(title)
+        for vertex in sorted(graph.keys()):
+            if vertex != tree.start:
+                path = tree.get_path(vertex)
+                print(f"To {vertex}: distance = {tree.distances[vertex]}, path = {' -> '.join(path)}")
+        print()
+
+    show("Shortest paths from vertex A:")
+    tree.set_edge('D', 'E', 10)
+    show("After D -> E becomes 10:")
+    tree.remove_edge('A', 'D')
+    show("After removing A -> D:")
+    tree.set_edge('A', 'C', 1)
+    show("After adding A -> C with weight 1:")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+class IndexedHeap:
+    """
+    d-ary min-heap over the integers 0..n-1 with true decrease-key.
+
+    position[item] is the index of item in the heap arrays, -1 when the item
+    is not in the heap, so every item appears at most once.
+    """
+    def __init__(self, n, arity=2):
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        self.arity = arity
+        self.items = []
+        self.priorities = []
+        self.position = [-1] * n
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return self.position[item] != -1
+
+    def push(self, item, priority):
+        """Insert item, or lower its priority if it is already in the heap"""
+        i = self.position[item]
+        if i == -1:
+            i = len(self.items)
+            self.items.append(item)
+            self.priorities.append(priority)
+            self.position[item] = i
+        elif priority < self.priorities[i]:
+            self.priorities[i] = priority
+        else:
+            return
+        self._sift_up(i)
+
+    decrease_key = push
+
+    def pop(self):
+        """Remove and return the (priority, item) pair with the smallest priority"""
+        items = self.items
+        priorities = self.priorities
+        top_item = items[0]
+        top_priority = priorities[0]
+        last_item = items.pop()
+        last_priority = priorities.pop()
+        self.position[top_item] = -1
+        if items:
+            items[0] = last_item
+            priorities[0] = last_priority
+            self.position[last_item] = 0
+            self._sift_down(0)
+        return top_priority, top_item
+
+    def _sift_up(self, i):
+        items = self.items
+        priorities = self.priorities
+        position = self.position
+        item = items[i]
+        priority = priorities[i]
+        while i > 0:
+            parent = (i - 1) // self.arity
+            if priorities[parent] <= priority:
+                break
+            # Move the parent down instead of swapping
+            items[i] = items[parent]
+            priorities[i] = priorities[parent]
+            position[items[i]] = i
+            i = parent
+        items[i] = item
+        priorities[i] = priority
+        position[item] = i
+
+    def _sift_down(self, i):
+        items = self.items
+        priorities = self.priorities
+        position = self.position
+        arity = self.arity
+        n = len(items)
+        item = items[i]
+        priority = priorities[i]
+        while True:
+            first = arity * i + 1
+            if first >= n:
+                break
+            # Find the smallest child
+            child = first
+            child_priority = priorities[first]
+            for c in range(first + 1, min(first + arity, n)):
+                if priorities[c] < child_priority:
+                    child = c
+                    child_priority = priorities[c]
+            if priority <= child_priority:
+                break
+            items[i] = items[child]
+            priorities[i] = child_priority
+            position[items[i]] = i
+            i = child
+        items[i] = item
+        priorities[i] = priority
+        position[item] = i
+
+
+class BucketQueue:
+    """
+    Dial's bucket queue for non-negative integer priorities.
+
+    Dijkstra with edge weights at most max_weight only ever holds priorities
+    in [d, d + max_weight], so max_weight + 1 circular buckets are enough.
+    Items may be any hashable value. Integer-valued floats such as 2.0 are
+    accepted as priorities and returned unchanged.
+    """
+    def __init__(self, max_weight):
+        self.buckets = [set() for _ in range(max_weight + 1)]
+        self.priority = {}
+        self.current = 0
+
+    def __len__(self):
+        return len(self.priority)
+
+    def __contains__(self, item):
+        return item in self.priority
+
+    def push(self, item, priority):
+        """Insert item, or lower its priority if it is already in the queue"""
+        old = self.priority.get(item)
+        if old is not None:
+            if priority >= old:
+                return
+            self._bucket(old).discard(item)
+        self.priority[item] = priority
+        self._bucket(priority).add(item)
+
+    decrease_key = push
+
+    def _bucket(self, priority):
+        return self.buckets[int(priority) % len(self.buckets)]
+
+    def pop(self):
+        """Remove and return a (priority, item) pair with the smallest priority"""
+        if not self.priority:
+            raise IndexError("pop from an empty bucket queue")
+        # Scan forward from the last popped priority to the next non-empty bucket
+        while not self.buckets[self.current % len(self.buckets)]:
+            self.current += 1
+        item = self.buckets[self.current % len(self.buckets)].pop()
+        return self.priority.pop(item), item
@@ -2,6 +2,8 @@ import uuid
 import networkx as nx
 import matplotlib.pyplot as plt
 
+from task_4_plot import draw_heap
+
 
 class Node:
     def __init__(self, key, color="skyblue"):
@@ -67,14 +69,26 @@ def build_heap_tree(heap_array):
     return nodes[0]
 
 
-def visualize_heap(heap_array):
+def visualize_heap(heap_array, layout="tree", **kwargs):
     """
     Visualizes a binary heap represented as an array
+
+    layout="index" places nodes straight from their array indices and draws
+    them in batches (see task_4_plot.draw_heap for the options), which scales
+    to heaps with hundreds of thousands of elements.
     """
-    if not heap_array:
+    if len(heap_array) == 0:
         print("Empty heap")
         return
 
+    if layout == "index":
+        _, ax = plt.subplots(figsize=(8, 5))
+        draw_heap(ax, heap_array, **kwargs)
+        plt.show()
+        return
+    if layout != "tree":
+        raise ValueError(f"Unknown layout: {layout}")
+
     # Build a tree from the heapheap
     root = build_heap_tree(heap_array)
 
@@ -86,29 +100,33 @@ def heapify(arr, n, i):
     """
     Converts the subtree rooted at i into a heapeap
     """
-    largest = i  # Initialize the largest element as the root
-    left = 2 * i + 1
-    right = 2 * i + 2
-
-    # Check if the left child exists and is greater than the root
-    if left < n and arr[left] > arr[largest]:
-        largest = left
-
-    # Check if the right child exists and is greater than the current largest
-    if right < n and arr[right] > arr[largest]:
-        largest = right
-
-    # If the largest element is not the root root
-    if largest != i:
+    # Walk down iteratively instead of recursing once per level
+    while True:
+        largest = i  # Initialize the largest element as the root
+        left = 2 * i + 1
+        right = 2 * i + 2
+
+        # Check if the left child exists and is greater than the root
+        if left < n and arr[left] > arr[largest]:
+            largest = left
+
+        # Check if the right child exists and is greater than the current largest
+        if right < n and arr[right] > arr[largest]:
+            largest = right
+
+        # If the root is already the largest, the subtree is a heap
+        if largest == i:
+            return
         arr[i], arr[largest] = arr[largest], arr[i]  # Swap elements
-        heapify(arr, n, largest)
+        i = largest
 
 
-def build_max_heap(arr):
+def build_max_heap(arr, in_place=False):
     """
     Builds a max-heap from an arrayan array
     """
-    arr = arr.copy()  # Create a copy to avoid modifying the originalnal
+    if not in_place:
+        arr = arr.copy()  # Create a copy to avoid modifying the originalnal
     n = len(arr)
 
     # Build the heap (rearrange the array)
@@ -0,0 +1,132 @@
+"""
+Iterative, in-place d-ary heaps on Python lists (or any mutable sequence).
+
+Every function takes the same options:
+arity -- number of children per node (2 gives the usual binary heap)
+key -- function applied to elements before comparing them, like sorted()
+max_heap -- keep the largest element on top instead of the smallest
+
+Sifting moves a "hole" instead of swapping, so each level costs one write.
+"""
+import operator
+
+
+def _less(key, max_heap):
+    """Return the comparison that decides whether a belongs above b"""
+    if key is None:
+        return operator.gt if max_heap else operator.lt
+    if max_heap:
+        return lambda a, b: key(a) > key(b)
+    return lambda a, b: key(a) < key(b)
+
+
+def sift_down(heap, i, n=None, arity=2, key=None, max_heap=False):
+    """Move heap[i] down within heap[:n] until both heap rules hold"""
+    if n is None:
+        n = len(heap)
+    above = _less(key, max_heap)
+    item = heap[i]
+    while True:
+        first = arity * i + 1
+        if first >= n:
+            break
+        # Pick the child that belongs highest
+        child = first
+        for c in range(first + 1, min(first + arity, n)):
+            if above(heap[c], heap[child]):
+                child = c
+        if not above(heap[child], item):
+            break
+        heap[i] = heap[child]
+        i = child
+    heap[i] = item
+
+
+def sift_up(heap, i, arity=2, key=None, max_heap=False):
+    """Move heap[i] up until its parent belongs above it"""
+    above = _less(key, max_heap)
+    item = heap[i]
+    while i > 0:
+        parent = (i - 1) // arity
+        if not above(item, heap[parent]):
+            break
+        heap[i] = heap[parent]
+        i = parent
+    heap[i] = item
+
+
+def heapify(heap, arity=2, key=None, max_heap=False):
+    """Rearrange the list into a heap in place, in O(n)"""
+    n = len(heap)
+    for i in range((n - 2) // arity, -1, -1):
+        sift_down(heap, i, n, arity, key, max_heap)
+
+
+def push(heap, item, arity=2, key=None, max_heap=False):
+    """Add item to the heap"""
+    heap.append(item)
+    sift_up(heap, len(heap) - 1, arity, key, max_heap)
+
+
+def pop(heap, arity=2, key=None, max_heap=False):
+    """Remove and return the top item"""
+    last = heap.pop()
+    if not heap:
+        return last
+    top = heap[0]
+    heap[0] = last
+    sift_down(heap, 0, len(heap), arity, key, max_heap)
+    return top
+
+
+def pushpop(heap, item, arity=2, key=None, max_heap=False):
+    """Push item, then pop and return the top item, faster than push + pop"""
+    if heap and _less(key, max_heap)(heap[0], item):
+        item, heap[0] = heap[0], item
+        sift_down(heap, 0, len(heap), arity, key, max_heap)
+    return item
+
+
+def replace(heap, item, arity=2, key=None, max_heap=False):
+    """Pop and return the top item, then push item; the heap must not be empty"""
+    top = heap[0]
+    heap[0] = item
+    sift_down(heap, 0, len(heap), arity, key, max_heap)
+    return top
+
+
+def heapsort(items, arity=2, key=None, reverse=False):
+    """
+    Sort the list in place with a heap and no extra memory.
+
+    Ascending order builds a max-heap and moves the top to the end of the
+    shrinking heap each step; reverse=True uses a min-heap. Not stable.
+    """
+    max_heap = not reverse
+    heapify(items, arity, key, max_heap)
+    for end in range(len(items) - 1, 0, -1):
+        items[0], items[end] = items[end], items[0]
+        sift_down(items, 0, end, arity, key, max_heap)
+
+
+def main():
+    arr = [3, 9, 2, 1, 4, 5]
+    print("Original array:", arr)
+
+    heap = arr.copy()
+    heapify(heap, max_heap=True)
+    print("Binary max-heap:", heap)
+
+    heap = arr.copy()
+    heapify(heap, arity=3)
+    print("Ternary min-heap:", heap)
+    push(heap, 0, arity=3)
+    print("After push(0):", heap)
+    print("pop():", pop(heap, arity=3), "->", heap)
+
+    words = ["pear", "fig", "banana", "kiwi"]
+    heapsort(words, key=len)
+    print("Words sorted by length:", words)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+import sys
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.figure import Figure
+
+MAX_LABELS = 64  # Above this many drawn nodes, labels are left out by default
+
+
+def level_starts(n, arity=2):
+    """Return the array index of the first node of every level, plus n at the end"""
+    starts = [0]
+    width = 1
+    while starts[-1] < n:
+        starts.append(starts[-1] + width)
+        width *= arity
+    starts[-1] = n
+    return np.array(starts, dtype=np.int64)
+
+
+def heap_layout(n, arity=2):
+    """
+    Compute node positions of an n-element heap straight from array indices.
+
+    Returns (x, y, depth) arrays. Level k holds arity**k slots spread evenly
+    over [-1, 1], so every subtree keeps its own slice of the axis; y is -depth.
+    For arity=2 this is the same layout that draw_tree in task_4 produces.
+    """
+    starts = level_starts(n, arity)
+    index = np.arange(n, dtype=np.int64)
+    depth = np.searchsorted(starts, index, side="right") - 1
+    slots = np.float64(arity) ** depth
+    x = 2 * (index - starts[depth] + 0.5) / slots - 1
+    return x, -depth.astype(np.float64), depth
+
+
+def heap_edges(x, y, arity=2):
+    """Return the (n - 1, 2, 2) array of parent-child segments"""
+    child = np.arange(1, len(x))
+    parent = (child - 1) // arity
+    return np.stack((np.column_stack((x[parent], y[parent])),
+                     np.column_stack((x[child], y[child]))), axis=1)
+
+
+def collapsed_counts(n, arity=2, max_depth=0):
+    """Return the number of hidden descendants of every node at max_depth"""
+    starts = level_starts(n, arity)
+    levels = len(starts) - 1
+    if max_depth >= levels:
+        return np.zeros(0, dtype=np.int64)
+    counts = np.zeros(starts[max_depth + 1] - starts[max_depth], dtype=np.int64)
+    # A node at depth k > max_depth belongs to slot (i - starts[k]) // arity**(k - max_depth)
+    for k in range(max_depth + 1, levels):
+        offsets = np.arange(starts[k + 1] - starts[k], dtype=np.int64) // arity ** (k - max_depth)
+        counts += np.bincount(offsets, minlength=len(counts))
+    return counts
+
+
+def draw_heap(ax, heap_array, arity=2, max_depth=None, color="skyblue", cmap=None,
+              labels=None, node_size=None, collapsed_color="lightgray"):
+    """
+    Draw a heap on matplotlib axes without creating a node object per element.
+
+    Nodes are one scatter call and edges one LineCollection. With max_depth,
+    levels below it are replaced by a triangle under each node at max_depth,
+    shaded by how many elements it hides. With cmap, nodes are colored by
+    value. labels defaults to True only for small drawings.
+    """
+    values = np.asarray(heap_array)
+    n = len(values)
+    if n == 0:
+        ax.axis("off")
+        return ax
+    x, y, depth = heap_layout(n, arity)
+    shown = n
+    if max_depth is not None:
+        shown = int(level_starts(n, arity)[min(max_depth + 1, depth[-1] + 1)])
+
+    ax.add_collection(LineCollection(heap_edges(x[:shown], y[:shown], arity),
+                                     colors="gray", linewidths=0.5, zorder=1))
+
+    if shown < n:
+        counts = collapsed_counts(n, arity, max_depth)
+        first = int(level_starts(n, arity)[max_depth])
+        has_children = np.flatnonzero(counts)
+        half_width = 1.0 / float(arity) ** max_depth
+        apex_x = x[first + has_children]
+        apex_y = np.full(len(has_children), -float(max_depth))
+        base_y = apex_y - 1
+        triangles = np.stack((
+            np.column_stack((apex_x, apex_y)),
+            np.column_stack((apex_x - half_width, base_y)),
+            np.column_stack((apex_x + half_width, base_y)),
+        ), axis=1)
+        hidden = counts[has_children]
+        ax.add_collection(PolyCollection(
+            triangles, facecolors=collapsed_color, edgecolors="none", zorder=0,
+            alpha=np.clip(hidden / hidden.max(), 0.2, 1.0),
+        ))
+
+    if node_size is None:
+        # Shrink nodes as the widest drawn level gets crowded
+        widest = float(arity) ** depth[shown - 1]
+        node_size = float(np.clip(2500 / widest, 1, 600))
+    if cmap is not None:
+        ax.scatter(x[:shown], y[:shown], s=node_size, c=values[:shown], cmap=cmap, zorder=2)
+    else:
+        ax.scatter(x[:shown], y[:shown], s=node_size, c=color, zorder=2)
+
+    if labels is None:
+        labels = shown <= MAX_LABELS
+    if labels:
+        for i in range(shown):
+            ax.text(x[i], y[i], str(values[i]), ha="center", va="center", zorder=3)
+
+    bottom = depth[shown - 1] + (1 if shown < n else 0)
+    ax.set_xlim(-1.05, 1.05)
+    ax.set_ylim(-bottom - 0.5, 0.5)
+    ax.axis("off")
+    return ax
+
+
+def save_heap_png(path, heap_array, width=1600, height=900, dpi=100, **kwargs):
+    """Render a heap to a PNG file without a display, see draw_heap for the options"""
+    figure = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+    FigureCanvasAgg(figure)
+    ax = figure.add_axes((0, 0, 1, 1))
+    draw_heap(ax, heap_array, **kwargs)
+    figure.savefig(path, dpi=dpi)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    heap = np.sort(np.random.rand(n))  # A sorted array is a valid min-heap
+    save_heap_png("heap_small.png", [0, 4, 1, 5, 10, 3])
+    print("Saved heap_small.png")
+    save_heap_png("heap_large.png", heap, cmap="viridis")
+    print(f"Saved heap_large.png with {n} elements")
+    save_heap_png("heap_collapsed.png", heap, max_depth=6, cmap="viridis")
+    print("Saved heap_collapsed.png with levels below depth 6 collapsed")
+
+
+if __name__ == "__main__":
+    main()
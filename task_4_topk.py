@@ -0,0 +1,213 @@
+import heapq
+import operator
+
+import numpy as np
+
+from task_4_heap import push, replace
+
+CHUNK_SIZE = 1 << 16  # Elements per NumPy chunk in top_k_array
+
+
+class TopK:
+    """
+    Keeps the k largest (or, with largest=False, smallest) items of a stream.
+
+    Memory stays O(k): the items are held in a bounded heap whose top is the
+    worst item kept, so most new items are rejected by a single comparison.
+    Ties are resolved like sorted(): earlier items win. Entries are
+    (key, tiebreak, item) tuples, so items themselves are never compared.
+
+    key is called per item, as in sorted(). array_key, used only by
+    update_array, is called once per chunk and must return an array of keys
+    of the chunk's shape; without it update_array applies key per element
+    and compares the keys on a slow object-dtype path when they are not
+    scalars, so pass array_key for large inputs.
+    """
+    def __init__(self, k, key=None, largest=True, array_key=None):
+        if k < 0:
+            raise ValueError("k must not be negative")
+        self.k = k
+        self.key = key
+        self.array_key = array_key
+        self.largest = largest
+        self.heap = []
+        self.count = 0  # Items seen so far, used as the tiebreak
+
+    def __len__(self):
+        return len(self.heap)
+
+    def _entry(self, value, order, item):
+        # The heap keeps the worst entry on top, so later items must compare worse
+        return (value, -order if self.largest else order, item)
+
+    def _offer(self, value, order, item):
+        heap = self.heap
+        max_heap = not self.largest
+        if len(heap) < self.k:
+            push(heap, self._entry(value, order, item), max_heap=max_heap)
+        elif heap and (value > heap[0][0] if self.largest else value < heap[0][0]):
+            replace(heap, self._entry(value, order, item), max_heap=max_heap)
+
+    def push(self, item):
+        """Offer a single item"""
+        value = item if self.key is None else self.key(item)
+        self._offer(value, self.count, item)
+        self.count += 1
+
+    def update(self, iterable):
+        """Offer every item of an iterable, consuming it lazily"""
+        heap = self.heap
+        key = self.key
+        largest = self.largest
+        k = self.k
+        order = self.count
+        for item in iterable:
+            value = item if key is None else key(item)
+            # Inline rejection test for the common case of a full heap
+            if len(heap) < k or heap and (value > heap[0][0] if largest else value < heap[0][0]):
+                self._offer(value, order, item)
+            order += 1
+        self.count = order
+
+    def update_array(self, chunk):
+        """
+        Offer a one-dimensional NumPy array of items.
+
+        Keys come from array_key, called once with the whole chunk, or else
+        from key, called per element. Only the elements of the chunk that can reach the
+        k best are passed on to the heap: the k-th best key is found with
+        np.partition, and everything at or beyond it is offered. Non-scalar
+        per-element keys, such as tuples, are held in an object array and
+        compared one by one in Python.
+        """
+        chunk = np.asarray(chunk)
+        values = self._array_keys(chunk)
+        if self.k == 0 or len(chunk) == 0:
+            self.count += len(chunk)
+            return
+        if len(chunk) > self.k:
+            kth = len(chunk) - self.k if self.largest else self.k - 1
+            kth_value = np.partition(values, kth)[kth]
+            # partition is unstable, so keep every tie of the k-th key, not just k indices
+            if self.largest:
+                best = np.flatnonzero(_compare(values, operator.ge, kth_value))
+            else:
+                best = np.flatnonzero(_compare(values, operator.le, kth_value))
+            # Drop candidates that cannot beat the current worst kept item
+            if len(self.heap) == self.k:
+                threshold = self.heap[0][0]
+                best = best[_compare(values[best], operator.gt if self.largest else operator.lt, threshold)]
+            # flatnonzero keeps stream order, so ties still favour earlier items
+        else:
+            best = np.arange(len(chunk))
+        # tolist() turns every dtype, object included, into plain Python values at once
+        count = self.count
+        for i, value, item in zip(best.tolist(), values[best].tolist(), chunk[best].tolist()):
+            self._offer(value, count + i, item)
+        self.count += len(chunk)
+
+    def _array_keys(self, chunk):
+        if self.array_key is not None:
+            values = np.asarray(self.array_key(chunk))
+            if values.shape != chunk.shape:
+                raise ValueError(f"array_key returned shape {values.shape}, expected {chunk.shape}")
+            return values
+        if self.key is None:
+            return chunk
+        # Per-element keys; an object array keeps tuple keys one per element
+        keys = [self.key(item) for item in chunk.tolist()]
+        values = np.array(keys)
+        if values.shape != chunk.shape:
+            values = np.empty(len(keys), dtype=object)
+            for i, value in enumerate(keys):
+                values[i] = value
+        return values
+
+    def merge(self, other):
+        """
+        Fold in the result of another selector, e.g. one run over another shard.
+
+        The other stream is treated as coming after this one, so ties favour
+        items of self.
+        """
+        if other.largest != self.largest:
+            raise ValueError("Cannot merge a top-k selector with a bottom-k one")
+        # Offer in stream order so the value-only test in _offer keeps ties right
+        entries = sorted((-tiebreak if other.largest else tiebreak, value, item)
+                         for value, tiebreak, item in other.heap)
+        for order, value, item in entries:
+            self._offer(value, self.count + order, item)
+        self.count += other.count
+        return self
+
+    def result(self):
+        """Return the kept items, best first"""
+        entries = sorted(self.heap, reverse=self.largest)
+        return [item for _, _, item in entries]
+
+
+def _compare(values, op, other):
+    """Apply op(value, other) to every key; object keys such as tuples one at a time"""
+    if values.dtype == object:
+        # NumPy would broadcast a tuple against the array instead of comparing whole keys
+        return np.fromiter((op(value, other) for value in values), dtype=bool, count=len(values))
+    return op(values, other)
+
+
+def top_k(iterable, k, key=None):
+    """Return the k largest items, largest first, like heapq.nlargest"""
+    selector = TopK(k, key)
+    selector.update(iterable)
+    return selector.result()
+
+
+def bottom_k(iterable, k, key=None):
+    """Return the k smallest items, smallest first, like heapq.nsmallest"""
+    selector = TopK(k, key, largest=False)
+    selector.update(iterable)
+    return selector.result()
+
+
+def top_k_array(chunks, k, key=None, largest=True, chunk_size=CHUNK_SIZE, array_key=None):
+    """
+    Select from NumPy input given as one array or an iterable of arrays.
+
+    A single array is split into chunk_size slices; memory-mapped arrays are
+    therefore read one slice at a time. Pass a vectorized key as array_key;
+    key is applied per element.
+    """
+    if isinstance(chunks, np.ndarray):
+        array = chunks
+        chunks = (array[start:start + chunk_size] for start in range(0, len(array), chunk_size))
+    selector = TopK(k, key, largest, array_key)
+    for chunk in chunks:
+        selector.update_array(chunk)
+    return selector.result()
+
+
+def main():
+    events = [("login", 3), ("error", 9), ("click", 2), ("error", 7), ("click", 9), ("logout", 1)]
+    print("Events:", events)
+    print("Top 3 by severity:", top_k(events, 3, key=lambda event: event[1]))
+    print("Bottom 2 by severity:", bottom_k(events, 2, key=lambda event: event[1]))
+
+    # Each shard is processed separately, then the partial results are merged
+    shards = [np.random.rand(100000) for _ in range(4)]
+    partial = [TopK(5) for _ in shards]
+    for selector, shard in zip(partial, shards):
+        selector.update_array(shard)
+    merged = partial[0]
+    for selector in partial[1:]:
+        merged.merge(selector)
+    print("Top 5 of 4 merged shards:", merged.result())
+    print("Same as sorting everything:", merged.result() == sorted(np.concatenate(shards).tolist())[-5:][::-1])
+
+    # Tuple keys take the object-dtype path once a chunk is longer than k
+    numbers = np.random.randint(0, 1000, 10000)
+    parity_key = lambda value: (value % 2, value)
+    print("Tuple keys match heapq.nlargest:",
+          top_k_array(numbers, 5, key=parity_key, chunk_size=1000)
+          == heapq.nlargest(5, numbers.tolist(), key=parity_key))
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,13 @@
 import matplotlib.pyplot as plt
 import networkx as nx
+import numpy as np
 import colorsys
 from collections import deque
+from matplotlib.colors import hsv_to_rgb
+
+from task_5_implicit import ImplicitTree
+
+MAX_LABELS = 64  # Larger trees are drawn without value labels
 
 class Node:
     def __init__(self, key):
@@ -50,87 +56,306 @@ def generate_colors(steps):
     
     return colors
 
+def color_array(steps):
+    """Same gradient as generate_colors, as an (steps, 3) RGB array computed in one pass"""
+    value = 0.3 + 0.6 * (np.arange(steps) / (steps - 1) if steps > 1 else np.full(steps, 0.5))
+    hsv = np.column_stack((np.full(steps, 0.6), np.full(steps, 0.8), value))
+    return hsv_to_rgb(hsv)
+
+def tree_layout(root):
+    """
+    Lay out a tree with integer ids 0..n-1 assigned in BFS order.
+    
+    Returns (nodes, values, x, y, parents) where parents[0] is -1. nodes holds
+    the Node objects of a linked tree, or the heap indices of an ImplicitTree.
+    Children sit 1 / 2**depth to the left and right of their parent, as in
+    the original build_graph. Positions are computed with whole-array
+    operations; an ImplicitTree needs no per-node Python work at all.
+    """
+    if isinstance(root, ImplicitTree):
+        nodes = root.bfs_order()
+        depth = np.floor(np.log2(nodes + 1)).astype(np.int64)
+        slot = nodes + 1 - 2 ** depth  # Position within the level of a complete tree
+        x = 4 * (slot + 0.5) / 2.0 ** depth - 2
+        rank = np.empty(root.capacity, dtype=np.int64)
+        rank[nodes] = np.arange(len(nodes))
+        parents = np.where(nodes > 0, rank[np.maximum(nodes - 1, 0) // 2], -1)
+        return nodes, root.bfs_values(), x, -depth.astype(np.float64), parents
+    
+    if not root:
+        empty = np.zeros(0)
+        return [], [], empty, empty, np.zeros(0, dtype=np.int64)
+    
+    # One pass over the nodes collects parents and sides; levels are contiguous ranges
+    nodes = [root]
+    parents = [-1]
+    sides = [0]
+    levels = []  # (start, end) of each level in nodes
+    start = 0
+    while start < len(nodes):
+        end = len(nodes)
+        for i in range(start, end):
+            node = nodes[i]
+            if node.left:
+                nodes.append(node.left)
+                parents.append(i)
+                sides.append(-1)
+            if node.right:
+                nodes.append(node.right)
+                parents.append(i)
+                sides.append(1)
+        levels.append((start, end))
+        start = end
+    
+    parents = np.array(parents, dtype=np.int64)
+    depth = np.repeat(np.arange(len(levels)), [end - start for start, end in levels])
+    x = np.array(sides, dtype=np.float64) * 0.5 ** (depth - 1.0)  # Offset from the parent
+    
+    # Pointer jumping sums the offsets along every root path in O(log depth) passes,
+    # so deep trees cost no more Python work than wide ones
+    ancestor = parents.copy()
+    below = np.flatnonzero(ancestor >= 0)
+    while len(below):
+        x[below] += x[ancestor[below]]
+        ancestor[below] = ancestor[ancestor[below]]
+        below = below[ancestor[below] >= 0]
+    return nodes, [node.val for node in nodes], x, -depth.astype(np.float64), parents
+
 def build_graph(root):
     """Convert binary tree to NetworkX graph for visualization"""
+    nodes, values, x, y, parents = tree_layout(root)
+    ids = range(len(values))
+    
     G = nx.DiGraph()
-    pos = {}
-    node_to_id = {}
+    G.add_nodes_from((node_id, {'value': value}) for node_id, value in zip(ids, values))
+    G.add_edges_from(zip(parents[1:].tolist(), ids[1:]))
+    pos = dict(zip(ids, zip(x.tolist(), y.tolist())))
     
-    # Build the graph using BFS
-    queue = deque([(root, '0', 0, 0)])  # (node, id, x, y)
-    while queue:
-        node, node_id, x, y = queue.popleft()
-        if node:
-            G.add_node(node_id, value=node.val)
-            pos[node_id] = (x, -y)  # Negative y to put root at top
-            node_to_id[node] = node_id
-            
-            if node.left:
-                left_id = f"{node_id}L"
-                G.add_edge(node_id, left_id)
-                queue.append((node.left, left_id, x-1/(2**(y)), y+1))
-            
-            if node.right:
-                right_id = f"{node_id}R"
-                G.add_edge(node_id, right_id)
-                queue.append((node.right, right_id, x+1/(2**(y)), y+1))
+    if isinstance(root, ImplicitTree):
+        node_to_id = dict(zip(root.iter_nodes(nodes), ids))
+    else:
+        node_to_id = dict(zip(nodes, ids))
     
     return G, pos, node_to_id
 
-def dfs_traversal(root):
-    """Perform DFS traversal using a stack (not recursion)"""
-    if not root:
-        return []
-    
-    visited = []
-    stack = [root]
+def draw_layout(ax, x, y, parents, colors, labels=None, node_size=700):
+    """
+    Draw a tree layout as one line for all edges and one scatter for all nodes
     
+    Returns the node collection and the list of label texts.
+    """
+    if len(x) > 1:
+        # A single polyline broken by NaNs renders far faster than one artist per edge
+        gaps = np.full(len(x) - 1, np.nan)
+        edges_x = np.column_stack((x[parents[1:]], x[1:], gaps)).ravel()
+        edges_y = np.column_stack((y[parents[1:]], y[1:], gaps)).ravel()
+        ax.plot(edges_x, edges_y, color='black', linewidth=1, zorder=1)
+    nodes = ax.scatter(x, y, s=node_size, c=colors, linewidths=0, zorder=2)
+    texts = []
+    if labels is not None:
+        for node_x, node_y, label in zip(x.tolist(), y.tolist(), labels):
+            texts.append(ax.text(node_x, node_y, str(label), ha='center', va='center', zorder=3))
+    ax.axis('off')
+    return nodes, texts
+
+def iter_dfs(root):
+    """Yield nodes in DFS (pre-order) order as they are visited, using a stack"""
+    if isinstance(root, ImplicitTree):
+        yield from root.iter_nodes(root.dfs_order("preorder"))
+        return
+    stack = [root] if root else []
     while stack:
         current = stack.pop()
-        visited.append(current)
+        yield current
         
         # Push right first so left is processed first (LIFO)
         if current.right:
             stack.append(current.right)
         if current.left:
             stack.append(current.left)
-    
-    return visited
 
-def bfs_traversal(root):
-    """Perform BFS traversal using a queue"""
-    if not root:
-        return []
-    
-    visited = []
-    queue = deque([root])
-    
+def iter_bfs(root):
+    """Yield nodes level by level as they are visited, using a queue"""
+    if isinstance(root, ImplicitTree):
+        yield from root.iter_nodes(root.bfs_order())
+        return
+    queue = deque([root] if root else [])
     while queue:
         current = queue.popleft()
-        visited.append(current)
+        yield current
         
         if current.left:
             queue.append(current.left)
         if current.right:
             queue.append(current.right)
+
+def iter_inorder(root):
+    """Yield nodes in in-order (left, node, right); the stack holds one path"""
+    if isinstance(root, ImplicitTree):
+        yield from root.iter_nodes(root.dfs_order("inorder"))
+        return
+    stack = []
+    current = root
+    while stack or current:
+        while current:
+            stack.append(current)
+            current = current.left
+        current = stack.pop()
+        yield current
+        current = current.right
+
+def iter_postorder(root):
+    """Yield nodes in post-order (left, right, node); the stack holds one path"""
+    if isinstance(root, ImplicitTree):
+        yield from root.iter_nodes(root.dfs_order("postorder"))
+        return
+    stack = []
+    current = root
+    last = None
+    while stack or current:
+        if current:
+            stack.append(current)
+            current = current.left
+            continue
+        top = stack[-1]
+        # != rather than 'is not': ImplicitTree views are new objects on every access
+        if top.right and top.right != last:
+            current = top.right
+        else:
+            last = stack.pop()
+            yield last
+
+def _morris_walk(root, preorder):
+    """Morris traversal: threads right pointers of predecessors instead of using a stack"""
+    current = root
+    while current:
+        if current.left is None:
+            yield current
+            current = current.right
+            continue
+        
+        # Rightmost node of the left subtree is the in-order predecessor
+        predecessor = current.left
+        while predecessor.right and predecessor.right is not current:
+            predecessor = predecessor.right
+        
+        if predecessor.right is None:
+            # First visit: thread the predecessor back to current, go left
+            if preorder:
+                yield current
+            predecessor.right = current
+            current = current.left
+        else:
+            # Second visit: the left subtree is done, remove the thread
+            predecessor.right = None
+            if not preorder:
+                yield current
+            current = current.right
+
+def _morris(root, preorder):
+    walk = _morris_walk(root, preorder)
+    try:
+        for node in walk:
+            yield node
+    finally:
+        # Stopped early: finish the walk without yielding so every thread is removed
+        for _ in walk:
+            pass
+
+def morris_inorder(root):
+    """
+    Yield nodes in in-order with O(1) extra memory.
     
-    return visited
+    The tree is temporarily modified while the generator runs and must not be
+    read or changed elsewhere until it is exhausted or closed. Closing it
+    early still walks the rest of the tree to restore it. An ImplicitTree
+    cannot be threaded, so its cached in-order permutation is used instead.
+    """
+    if isinstance(root, ImplicitTree):
+        return iter_inorder(root)
+    return _morris(root, preorder=False)
+
+def morris_preorder(root):
+    """Yield nodes in pre-order with O(1) extra memory, see morris_inorder"""
+    if isinstance(root, ImplicitTree):
+        return iter_dfs(root)
+    return _morris(root, preorder=True)
+
+TRAVERSALS = {
+    'DFS': (iter_dfs, "Depth-First Search (DFS) Traversal"),
+    'BFS': (iter_bfs, "Breadth-First Search (BFS) Traversal"),
+    'INORDER': (iter_inorder, "In-Order Traversal"),
+    'POSTORDER': (iter_postorder, "Post-Order Traversal"),
+    'MORRIS': (morris_inorder, "Morris In-Order Traversal"),
+}
+
+# Which cached ImplicitTree permutation matches each traversal
+IMPLICIT_ORDERS = {
+    iter_dfs: "preorder",
+    morris_preorder: "preorder",
+    iter_inorder: "inorder",
+    morris_inorder: "inorder",
+    iter_postorder: "postorder",
+}
+
+def traversal_ids(root, traversal_type, nodes):
+    """Layout ids (see tree_layout) of the nodes in traversal order"""
+    traverse, _ = TRAVERSALS.get(traversal_type, TRAVERSALS['BFS'])
+    if isinstance(root, ImplicitTree):
+        if traverse is iter_bfs:
+            return np.arange(len(nodes))
+        rank = np.empty(root.capacity, dtype=np.int64)
+        rank[nodes] = np.arange(len(nodes))
+        return rank[root.dfs_order(IMPLICIT_ORDERS[traverse])]
+    node_to_id = {node: node_id for node_id, node in enumerate(nodes)}
+    return np.array([node_to_id[node] for node in traverse(root)], dtype=np.int64)
 
-def visualize_traversal(root, traversal_type):
-    """Visualize tree traversal with colored nodes"""
+def dfs_traversal(root):
+    """Perform DFS traversal using a stack (not recursion)"""
+    return list(iter_dfs(root))
+
+def bfs_traversal(root):
+    """Perform BFS traversal using a queue"""
+    return list(iter_bfs(root))
+
+def visualize_traversal(root, traversal_type, use_networkx=True, max_labels=MAX_LABELS):
+    """
+    Visualize tree traversal with colored nodes
+    
+    With use_networkx=False the tree is drawn straight from tree_layout with
+    batched matplotlib collections, which handles trees with millions of
+    nodes; values are only written on trees of up to max_labels nodes.
+    """
     if not root:
         return []
     
+    traverse, title = TRAVERSALS.get(traversal_type, TRAVERSALS['BFS'])
+    filename = f"{traversal_type.lower()}_traversal.png"
+    
+    if not use_networkx:
+        nodes, values, x, y, parents = tree_layout(root)
+        order = traversal_ids(root, traversal_type, nodes)
+        colors = np.empty((len(order), 3))
+        colors[order] = color_array(len(order))
+        
+        figure, ax = plt.subplots(figsize=(12, 8))
+        labels = values if len(values) <= max_labels else None
+        node_size = 700 if labels is not None else max(1.0, 700 / np.sqrt(len(values)))
+        draw_layout(ax, x, y, parents, colors, labels, node_size)
+        ax.set_title(title)
+        figure.savefig(filename)  # plt.savefig would draw the figure a second time
+        plt.show()
+        if isinstance(values, np.ndarray):
+            # An implicit tree's value array; tolist() matches ImplicitNode.val
+            return values[order].tolist()
+        # Index the original sequence so mixed, tuple and NumPy values come back unchanged
+        return [values[i] for i in order.tolist()]
+    
     # Build the graph
     G, pos, node_to_id = build_graph(root)
     
-    # Perform traversal
-    if traversal_type == 'DFS':
-        visited_nodes = dfs_traversal(root)
-        title = "Depth-First Search (DFS) Traversal"
-    else:  # BFS
-        visited_nodes = bfs_traversal(root)
-        title = "Breadth-First Search (BFS) Traversal"
+    # Perform traversal (anything unknown falls back to BFS)
+    visited_nodes = list(traverse(root))
     
     # Generate colors based on traversal order
     colors = generate_colors(len(visited_nodes))
@@ -151,7 +376,6 @@ def visualize_traversal(root, traversal_type):
     
     plt.title(title)
     plt.axis('off')
-    filename = f"{traversal_type.lower()}_traversal.png"
     plt.savefig(filename)
     plt.show()
     
@@ -170,3 +394,9 @@ if __name__ == "__main__":
     # Visualize BFS traversal
     bfs_result = visualize_traversal(root, 'BFS')
     print("BFS traversal order:", bfs_result)
+    
+    # Generators visit nodes lazily, so a search stops at the first match
+    print("In-order:", [node.val for node in iter_inorder(root)])
+    print("Post-order:", [node.val for node in iter_postorder(root)])
+    print("Morris in-order:", [node.val for node in morris_inorder(root)])
+    print("First DFS value above 10:", next(node.val for node in iter_dfs(root) if node.val > 10))
@@ -0,0 +1,187 @@
+import os
+import shutil
+import subprocess
+
+import matplotlib
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import GifImagePlugin, Image
+
+from task_5 import MAX_LABELS, TRAVERSALS, build_tree_from_list, color_array, draw_layout, traversal_ids, tree_layout
+from task_5_implicit import ImplicitTree
+
+UNVISITED_COLOR = (0.8, 0.8, 0.8)  # '#CCCCCC', as in visualize_traversal
+GIF_GRADIENT = 240  # Palette entries for the traversal gradient; the rest cover gray, white and black
+
+
+class PngFrames:
+    """Writes every frame to its own PNG file in a directory"""
+    def __init__(self, directory, size, fps):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.size = size
+        self.count = 0
+
+    def write(self, rgba):
+        path = os.path.join(self.directory, f"frame_{self.count:05d}.png")
+        Image.frombuffer("RGBA", self.size, rgba, "raw", "RGBA", 0, 1).save(path)
+        self.count += 1
+
+    def close(self):
+        pass
+
+
+class GifFrames:
+    """
+    Streams frames into an animated GIF as they arrive.
+
+    Frames are mapped to one fixed palette (the traversal gradient plus
+    grays), so no frame is kept after it has been written.
+    """
+    def __init__(self, path, size, fps):
+        self.file = open(path, "wb")
+        self.size = size
+        self.duration = int(1000 / fps)
+        colors = np.vstack((color_array(GIF_GRADIENT), np.linspace(0, 1, 256 - GIF_GRADIENT)[:, None].repeat(3, 1)))
+        self.palette = Image.new("P", (1, 1))
+        self.palette.putpalette((colors * 255).round().astype(np.uint8).ravel().tolist())
+        self.started = False
+
+    def write(self, rgba):
+        frame = Image.frombuffer("RGBA", self.size, rgba, "raw", "RGBA", 0, 1).convert("RGB")
+        frame = frame.quantize(palette=self.palette, dither=Image.Dither.NONE)
+        if not self.started:
+            header, _ = GifImagePlugin.getheader(frame, info={"loop": 0})
+            self.file.write(b"".join(header))
+            self.started = True
+        self.file.write(b"".join(GifImagePlugin.getdata(frame, duration=self.duration)))
+
+    def close(self):
+        self.file.write(b";")
+        self.file.close()
+
+
+class FfmpegFrames:
+    """Pipes raw RGBA frames to an ffmpeg process, which encodes them on the fly"""
+    def __init__(self, path, size, fps):
+        ffmpeg = shutil.which(matplotlib.rcParams["animation.ffmpeg_path"])
+        if ffmpeg is None:
+            raise RuntimeError("Writing video needs ffmpeg; write a .gif or a directory of PNG frames instead")
+        width, height = size
+        self.process = subprocess.Popen(
+            [ffmpeg, "-y", "-loglevel", "error", "-f", "rawvideo", "-pix_fmt", "rgba",
+             "-s", f"{width}x{height}", "-r", str(fps), "-i", "-",
+             "-pix_fmt", "yuv420p", "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", path],
+            stdin=subprocess.PIPE,
+        )
+
+    def write(self, rgba):
+        self.process.stdin.write(rgba)
+
+    def close(self):
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise RuntimeError("ffmpeg failed to encode the animation")
+
+
+def frame_writer(out, size, fps):
+    """Choose a writer from the output name: .gif, a video extension, or a directory for PNG frames"""
+    extension = os.path.splitext(out)[1].lower()
+    if extension == ".gif":
+        return GifFrames(out, size, fps)
+    if extension in (".mp4", ".webm", ".mkv", ".avi", ".mov"):
+        return FfmpegFrames(out, size, fps)
+    return PngFrames(out, size, fps)
+
+
+def visit_ids(root, traversal_type, nodes):
+    """Yield layout ids in traversal order, advancing the traversal generator lazily"""
+    if isinstance(root, ImplicitTree):
+        # The order of an implicit tree is one cached permutation anyway
+        yield from traversal_ids(root, traversal_type, nodes).tolist()
+        return
+    traverse, _ = TRAVERSALS.get(traversal_type, TRAVERSALS['BFS'])
+    node_to_id = {node: node_id for node_id, node in enumerate(nodes)}
+    for node in traverse(root):
+        yield node_to_id[node]
+
+
+def animate_traversal(root, traversal_type, out, nodes_per_frame=1, fps=10,
+                      width=1200, height=800, dpi=100, max_labels=MAX_LABELS):
+    """
+    Animate a traversal into out without a display and return the number of frames.
+
+    The tree is drawn once. Every frame then draws only the nodes visited
+    since the previous frame, through a single reused collection whose
+    offsets and face colors are replaced, on top of the existing canvas.
+    The cost of a frame depends on nodes_per_frame and the image size, not
+    on the size of the tree.
+    """
+    nodes, values, x, y, parents = tree_layout(root)
+    if len(values) == 0:
+        return 0
+    _, title = TRAVERSALS.get(traversal_type, TRAVERSALS['BFS'])
+    colors = color_array(len(values))  # Colored by visit rank, as in visualize_traversal
+    labels = values if len(values) <= max_labels else None
+    node_size = 700 if labels is not None else max(1.0, 700 / np.sqrt(len(values)))
+
+    figure = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+    canvas = FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    _, texts = draw_layout(ax, x, y, parents, [UNVISITED_COLOR], labels, node_size)
+    ax.set_title(title)
+    # Animated artists are left out of canvas.draw() and painted by hand
+    visited = ax.scatter([], [], s=node_size, linewidths=0, zorder=2, animated=True)
+    for text in texts:
+        text.set_animated(True)
+    canvas.draw()
+    for text in texts:
+        ax.draw_artist(text)
+
+    writer = frame_writer(out, canvas.get_width_height(), fps)
+    frames = 0
+    try:
+        writer.write(canvas.buffer_rgba())
+        frames += 1
+        rank = 0
+        batch = []
+        for node_id in visit_ids(root, traversal_type, nodes):
+            batch.append(node_id)
+            if len(batch) < nodes_per_frame:
+                continue
+            rank = _draw_batch(ax, visited, texts, x, y, colors, batch, rank)
+            writer.write(canvas.buffer_rgba())
+            frames += 1
+            batch = []
+        if batch:
+            _draw_batch(ax, visited, texts, x, y, colors, batch, rank)
+            writer.write(canvas.buffer_rgba())
+            frames += 1
+    finally:
+        writer.close()
+    return frames
+
+
+def _draw_batch(ax, visited, texts, x, y, colors, batch, rank):
+    """Paint the newly visited nodes (and their labels) over the canvas"""
+    batch = np.array(batch)
+    visited.set_offsets(np.column_stack((x[batch], y[batch])))
+    visited.set_facecolors(colors[rank:rank + len(batch)])
+    ax.draw_artist(visited)
+    for node_id in batch.tolist() if texts else ():
+        ax.draw_artist(texts[node_id])
+    return rank + len(batch)
+
+
+def main():
+    root = build_tree_from_list(list(range(1, 16)))
+    frames = animate_traversal(root, 'DFS', "dfs_traversal.gif", fps=2)
+    print(f"Saved dfs_traversal.gif ({frames} frames)")
+
+    tree = ImplicitTree(np.arange(4095))
+    frames = animate_traversal(tree, 'BFS', "bfs_frames", nodes_per_frame=64)
+    print(f"Saved {frames} PNG frames of a {len(tree)} node BFS to bfs_frames/")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+from functools import lru_cache
+
+import numpy as np
+
+ORDERS = ("preorder", "inorder", "postorder")
+ORDER_CACHE_SIZE = 8  # Complete tree shapes whose DFS permutations are kept
+
+
+def _levels(n):
+    """Yield the index arrays of each level of an n-node complete tree, root first"""
+    start = 0
+    width = 1
+    while start < n:
+        yield np.arange(start, min(start + width, n), dtype=np.int64)
+        start += width
+        width *= 2
+
+
+def _subtree_sizes(n):
+    """Number of nodes in the subtree of every index of an n-node complete tree"""
+    sizes = np.ones(n, dtype=np.int64)
+    for level in reversed(list(_levels(n))):
+        for child in (2 * level + 1, 2 * level + 2):
+            has_child = child < n
+            sizes[level[has_child]] += sizes[child[has_child]]
+    return sizes
+
+
+@lru_cache(maxsize=ORDER_CACHE_SIZE)
+def complete_order(n, order):
+    """
+    Return the heap indices of an n-node complete tree in pre-, in- or post-order.
+
+    Every subtree covers a contiguous range of positions in a DFS order, so
+    the ranges are split level by level from subtree sizes without visiting
+    nodes one at a time. The result is cached and read-only.
+    """
+    if order not in ORDERS:
+        raise ValueError(f"Unknown order: {order}")
+    sizes = _subtree_sizes(n)
+    start = np.zeros(n, dtype=np.int64)  # First position of each subtree's range
+    position = np.empty(n, dtype=np.int64)
+    for level in _levels(n):
+        left = 2 * level + 1
+        right = left + 1
+        left_size = np.where(left < n, sizes[np.minimum(left, n - 1)], 0)
+        if order == "preorder":
+            position[level] = start[level]
+            left_start, right_start = start[level] + 1, start[level] + 1 + left_size
+        elif order == "inorder":
+            position[level] = start[level] + left_size
+            left_start, right_start = start[level], start[level] + left_size + 1
+        else:
+            position[level] = start[level] + sizes[level] - 1
+            left_start, right_start = start[level], start[level] + left_size
+        has_left = left < n
+        has_right = right < n
+        start[left[has_left]] = left_start[has_left]
+        start[right[has_right]] = right_start[has_right]
+
+    permutation = np.empty(n, dtype=np.int64)
+    permutation[position] = np.arange(n, dtype=np.int64)
+    permutation.flags.writeable = False
+    return permutation
+
+
+class ImplicitNode:
+    """
+    Read-only view of one position of an ImplicitTree.
+
+    It has the val/left/right interface of task_5.Node, so code written for
+    linked trees can walk an implicit tree. Views of the same position
+    compare equal.
+    """
+    __slots__ = ("tree", "index")
+
+    def __init__(self, tree, index):
+        self.tree = tree
+        self.index = index
+
+    @property
+    def val(self):
+        value = self.tree.values[self.index]
+        # Object arrays hold plain Python values, which have no item()
+        return value.item() if isinstance(value, np.generic) else value
+
+    @property
+    def left(self):
+        return self.tree.node(2 * self.index + 1)
+
+    @property
+    def right(self):
+        return self.tree.node(2 * self.index + 2)
+
+    def __eq__(self, other):
+        return isinstance(other, ImplicitNode) and self.tree is other.tree and self.index == other.index
+
+    def __hash__(self):
+        return hash((id(self.tree), self.index))
+
+    def __repr__(self):
+        return f"ImplicitNode({self.val!r}, index={self.index})"
+
+
+class ImplicitTree:
+    """
+    Binary tree stored in heap layout: the children of index i are 2i+1 and 2i+2.
+
+    Values live in one NumPy array. present is an optional boolean mask for
+    holes; a missing node must not have children. Without it the tree is
+    complete. BFS order is the array order, and DFS orders come from
+    complete_order filtered by the mask: removing whole subtrees keeps the
+    relative order of the remaining nodes.
+    """
+    def __init__(self, values, present=None):
+        self.values = np.asarray(values)
+        if present is not None:
+            present = np.asarray(present, dtype=bool)
+            if present.shape != self.values.shape:
+                raise ValueError("values and present must have the same length")
+            parents = (np.arange(1, len(present)) - 1) // 2
+            if np.any(present[1:] & ~present[parents]):
+                raise ValueError("A missing node cannot have children")
+            if present.all():
+                present = None
+        self.present = present
+        self._orders = {}  # order -> cached index permutation
+
+    @classmethod
+    def from_list(cls, values, fill=0):
+        """
+        Build from a list in heap layout, with None marking holes.
+
+        This matches build_tree_from_list only when no position below a None
+        is listed; build_tree_from_list skips the children of missing nodes.
+        """
+        present = np.array([value is not None for value in values], dtype=bool)
+        array = np.array([fill if value is None else value for value in values])
+        return cls(array, present)
+
+    @property
+    def capacity(self):
+        """Length of the underlying arrays, including holes"""
+        return len(self.values)
+
+    def __len__(self):
+        if self.present is None:
+            return len(self.values)
+        return int(np.count_nonzero(self.present))
+
+    def has(self, index):
+        return index < len(self.values) and (self.present is None or bool(self.present[index]))
+
+    def node(self, index):
+        """View of the node at index, or None if there is no node there"""
+        return ImplicitNode(self, index) if self.has(index) else None
+
+    @property
+    def root(self):
+        return self.node(0)
+
+    def bfs_order(self):
+        """Indices in level order"""
+        if self.present is None:
+            return np.arange(len(self.values))
+        return np.flatnonzero(self.present)
+
+    def bfs_values(self):
+        """Values in level order; without holes this is the array itself"""
+        if self.present is None:
+            return self.values
+        return self.values[self.present]
+
+    def dfs_order(self, order="preorder"):
+        """Indices in pre-, in- or post-order"""
+        permutation = self._orders.get(order)
+        if permutation is None:
+            permutation = complete_order(len(self.values), order)
+            if self.present is not None:
+                permutation = permutation[self.present[permutation]]
+            self._orders[order] = permutation
+        return permutation
+
+    def dfs_values(self, order="preorder"):
+        return self.values[self.dfs_order(order)]
+
+    def iter_nodes(self, indices):
+        """Yield a node view for each index"""
+        for index in indices.tolist():
+            yield ImplicitNode(self, index)
+
+
+def main():
+    tree = ImplicitTree(np.arange(1, 16))
+    print("Values:", tree.values.tolist())
+    print("BFS:", tree.bfs_values().tolist())
+    for order in ORDERS:
+        print(f"{order}:", tree.dfs_values(order).tolist())
+
+    holes = ImplicitTree.from_list([1, 2, 3, None, 5, 6, None])
+    print("Tree with holes, pre-order:", holes.dfs_values().tolist())
+    print("Root:", holes.root, "left:", holes.root.left, "left.left:", holes.root.left.left)
+
+if __name__ == "__main__":
+    main()